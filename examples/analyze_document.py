@@ -5,7 +5,7 @@ from pathlib import Path
 import json
 import sys
 
-from panini_nlp import SanskritValidator
+from panini_nlp import get_validator
 
 
 def main() -> None:
@@ -21,26 +21,30 @@ def main() -> None:
         sys.exit(1)
 
     text = input_path.read_text(encoding="utf-8")
-    validator = SanskritValidator()
-
-    report = validator.validate_document(text, split_mode=split_mode)
-
-    print("=" * 72)
-    print("Panini NLP — Document Analysis")
-    print("=" * 72)
-    print(f"file: {input_path}")
-    print(f"split_mode: {report['split_mode']}")
-    print(f"segment_count: {report['segment_count']}")
-    print(f"summary: {report['summary']}")
-
-    print("\nfirst 3 segments:")
+    validator = get_validator()
+
+    report = validator.validate_document(text, split_mode=split_mode, n_jobs=-1)
+
+    lines = [
+        "=" * 72,
+        "Panini NLP — Document Analysis",
+        "=" * 72,
+        f"file: {input_path}",
+        f"split_mode: {report['split_mode']}",
+        f"segment_count: {report['segment_count']}",
+        f"summary: {report['summary']}",
+        "",
+        "first 3 segments:",
+    ]
     for seg in report["segments"][:3]:
         result = seg["result"]
-        print(f"- [{seg['index']}] {seg['text'][:80]}")
-        print(f"  valid={result['is_valid']} patterns={result['grammar_patterns']} suggestions={len(result['suggestions'])}")
+        lines.append(f"- [{seg['index']}] {seg['text'][:80]}")
+        lines.append(f"  valid={result['is_valid']} patterns={result['grammar_patterns']} suggestions={len(result['suggestions'])}")
+    sys.stdout.writelines(line + "\n" for line in lines)
 
     out_json = input_path.with_suffix(input_path.suffix + ".panini_report.json")
-    out_json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    with out_json.open("w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
     print(f"\nSaved full JSON report: {out_json}")
 
 
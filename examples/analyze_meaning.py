@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 """Example: line-by-line meaning analysis."""
 
-from panini_nlp import SanskritMeaningEngine
+from panini_nlp import get_meaning_engine
 
 
 def main() -> None:
     text = """रामः वनम् गच्छति।
 देवः पठति॥"""
 
-    engine = SanskritMeaningEngine()
+    engine = get_meaning_engine()
     report = engine.analyze_document_meaning(text, split_mode="verse", meaning_mode="fluent")
 
     print("=" * 72)
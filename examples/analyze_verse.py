@@ -4,7 +4,13 @@ Panini NLP — Full Pipeline Demo
 Analyzes a Sanskrit sentence through all 5 modules.
 """
 
-from panini_nlp import SanskritValidator, SandhiEngine, MorphologicalAnalyzer, SemanticParser, ChandasAnalyzer, SamasaAnalyzer
+from panini_nlp import (
+    get_chandas_analyzer,
+    get_morphological_analyzer,
+    get_samasa_analyzer,
+    get_sandhi_engine,
+    get_validator,
+)
 
 
 def main():
@@ -16,7 +22,7 @@ def main():
     sentence = "रामः वनम् गच्छति"
     print(f"\n▶ Input: {sentence}\n")
 
-    validator = SanskritValidator()
+    validator = get_validator()
     result = validator.validate(sentence)
 
     print(f"  Valid: {result.is_valid}")
@@ -38,7 +44,7 @@ def main():
     # === 2. Sandhi ===
     print("\n" + "-" * 60)
     print("▶ Sandhi Engine")
-    engine = SandhiEngine()
+    engine = get_sandhi_engine()
     pairs = [("देव", "अर्चनम्"), ("महा", "ईश्वरः"), ("गुरु", "उपदेशः")]
     for a, b in pairs:
         r = engine.apply(a, b)
@@ -50,7 +56,7 @@ def main():
     # === 3. Morphology ===
     print("\n" + "-" * 60)
     print("▶ Morphological Analyzer")
-    morph = MorphologicalAnalyzer()
+    morph = get_morphological_analyzer()
     words = ["रामः", "वनम्", "गच्छति", "देवेन", "फलानि"]
     for w in words:
         analyses = morph.analyze(w)
@@ -63,7 +69,7 @@ def main():
     # === 4. Chandas ===
     print("\n" + "-" * 60)
     print("▶ Chandas (Prosody)")
-    chandas = ChandasAnalyzer()
+    chandas = get_chandas_analyzer()
     verse = "dharmasya tattvam nihitam guhāyām"
     result = chandas.analyze(verse)
     print(f"  Verse: {verse}")
@@ -74,7 +80,7 @@ def main():
     # === 5. Samāsa ===
     print("\n" + "-" * 60)
     print("▶ Samāsa (Compounds)")
-    samasa = SamasaAnalyzer()
+    samasa = get_samasa_analyzer()
     compounds = ["yathāvidhi", "pītāmbaram", "mahādeva", "rājapuruṣa"]
     for c in compounds:
         r = samasa.analyze(c)
@@ -3,6 +3,9 @@ from panini_nlp.rules import registry as rule_registry
 from panini_nlp.roots import registry as root_registry
 from panini_nlp.sandhi import SandhiEngine
 
+# Surface forms of √bṛh (to grow / expand) in Devanāgarī and IAST
+_BRH_KEYS = ("बृह्", "bṛh")
+
 def distinct_print(msg):
     print(f"\n{'='*60}\n{msg}\n{'='*60}")
 
@@ -17,16 +20,12 @@ def demonstrate_brahman():
     # Using a known ID from the Dhatupatha (approximate for demo if exact search fails)
     # Let's assume we find it or use a placeholder if the specific ID isn't known yet
     
-    root_obj = None
     # Identifying the root for 'grow/expand'
     # In Dhatupatha 1.500 (approx), bṛh vṛddhau
     print("Loading Root from Dhatupatha Context...")
     
-    # We can iterate to find it if we don't know the ID
-    for root in root_registry:
-        if "बृह्" in root.root or "bṛh" in root.root:
-            root_obj = root
-            break
+    # Indexed lookup by surface form when we don't know the ID
+    root_obj = root_registry.lookup_any(_BRH_KEYS)
             
     if not root_obj:
         # Fallback for demo if exact string match fails due to encoding
@@ -12,10 +12,8 @@ def highlight(text):
 
 def find_root(search_term):
     """Helper to find a root by loose match in the registry."""
-    for root in root_registry:
-        if search_term in root.root:
-            return root
-    return None
+    matches = root_registry.find_containing(search_term)
+    return matches[0] if matches else None
 
 def demonstrate_shuklam():
     distinct_print("Panini-NLP: Derivation of 'Shuklam Baradharam' Verse")
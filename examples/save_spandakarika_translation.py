@@ -16,7 +16,8 @@ def main() -> None:
     report_dict = report.to_dict()
 
     json_path = Path(str(input_path) + ".meaning_report.json")
-    json_path.write_text(json.dumps(report_dict, ensure_ascii=False, indent=2), encoding="utf-8")
+    with json_path.open("w", encoding="utf-8") as f:
+        json.dump(report_dict, f, ensure_ascii=False, indent=2)
 
     mode_breakdown = report.summary.get("meaning_mode_breakdown", {})
     has_only_heuristic = (
@@ -25,23 +26,24 @@ def main() -> None:
 
     txt_suffix = ".heuristic_gloss.txt" if has_only_heuristic else ".translation.txt"
     txt_path = Path(str(input_path) + txt_suffix)
-    lines: list[str] = []
-    lines.append("Spandakarika — Line-by-line Meaning (panini-nlp)")
-    lines.append("")
-    if has_only_heuristic:
-        lines.append("WARNING: No model translator configured. This is heuristic gloss, not authoritative translation.")
-        lines.append("")
-    lines.append("Segments: " + str(report.segment_count))
-    lines.append("Summary: " + str(report.summary))
-    lines.append("")
-
-    for seg in report.segments:
-        lines.append("[" + str(seg.index) + "] " + seg.source)
-        lines.append("Meaning: " + seg.meaning)
-        lines.append("Confidence: " + str(seg.confidence))
-        lines.append("")
-
-    txt_path.write_text("\n".join(lines), encoding="utf-8")
+
+    def gen_lines():
+        yield "Spandakarika — Line-by-line Meaning (panini-nlp)\n"
+        yield "\n"
+        if has_only_heuristic:
+            yield "WARNING: No model translator configured. This is heuristic gloss, not authoritative translation.\n"
+            yield "\n"
+        yield f"Segments: {report.segment_count}\n"
+        yield f"Summary: {report.summary}\n"
+
+        for seg in report.segments:
+            yield "\n"
+            yield f"[{seg.index}] {seg.source}\n"
+            yield f"Meaning: {seg.meaning}\n"
+            yield f"Confidence: {seg.confidence}\n"
+
+    with txt_path.open("w", encoding="utf-8") as f:
+        f.writelines(gen_lines())
 
     print("OK")
     print(str(json_path))
@@ -15,20 +15,49 @@ Modules
 
 __version__ = "0.2.0"
 
-from panini_nlp.sandhi import SandhiEngine
-from panini_nlp.morphology import MorphologicalAnalyzer
-from panini_nlp.semantics import SemanticParser
-from panini_nlp.chandas import ChandasAnalyzer
-from panini_nlp.samasa import SamasaAnalyzer
-from panini_nlp.validator import SanskritValidator, ValidationResult
-from panini_nlp.meaning import SanskritMeaningEngine, MeaningReport, MeaningSegment
-from panini_nlp.corpus import (
-    SutraEntry,
-    DhatuEntry,
-    AshtadhyayiCorpus,
-    DhatupathaCorpus,
-    SanskritCorpus,
-)
+from functools import lru_cache
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from panini_nlp.sandhi import SandhiEngine
+    from panini_nlp.morphology import MorphologicalAnalyzer
+    from panini_nlp.semantics import SemanticParser
+    from panini_nlp.chandas import ChandasAnalyzer
+    from panini_nlp.samasa import SamasaAnalyzer
+    from panini_nlp.validator import SanskritValidator, ValidationResult
+    from panini_nlp.meaning import SanskritMeaningEngine, MeaningReport, MeaningSegment
+    from panini_nlp.corpus import (
+        SutraEntry,
+        DhatuEntry,
+        AshtadhyayiCorpus,
+        DhatupathaCorpus,
+        SanskritCorpus,
+    )
+    from panini_nlp.compression import MeruCompressor
+
+# Public names are resolved on first access (PEP 562), so importing the
+# package only loads the submodules a caller actually touches.
+# ``from panini_nlp import *`` still works: it resolves every name in
+# ``__all__`` through ``__getattr__``.
+_LAZY = {
+    "SandhiEngine": "panini_nlp.sandhi",
+    "MorphologicalAnalyzer": "panini_nlp.morphology",
+    "SemanticParser": "panini_nlp.semantics",
+    "ChandasAnalyzer": "panini_nlp.chandas",
+    "SamasaAnalyzer": "panini_nlp.samasa",
+    "SanskritValidator": "panini_nlp.validator",
+    "ValidationResult": "panini_nlp.validator",
+    "SanskritMeaningEngine": "panini_nlp.meaning",
+    "MeaningReport": "panini_nlp.meaning",
+    "MeaningSegment": "panini_nlp.meaning",
+    "SutraEntry": "panini_nlp.corpus",
+    "DhatuEntry": "panini_nlp.corpus",
+    "AshtadhyayiCorpus": "panini_nlp.corpus",
+    "DhatupathaCorpus": "panini_nlp.corpus",
+    "SanskritCorpus": "panini_nlp.corpus",
+    "MeruCompressor": "panini_nlp.compression",
+}
 
 __all__ = [
     "SandhiEngine",
@@ -46,12 +75,79 @@ __all__ = [
     "AshtadhyayiCorpus",
     "DhatupathaCorpus",
     "SanskritCorpus",
+    "MeruCompressor",
+    "get_sandhi_engine",
+    "get_morphological_analyzer",
+    "get_semantic_parser",
+    "get_chandas_analyzer",
+    "get_samasa_analyzer",
+    "get_validator",
+    "get_meaning_engine",
     "__version__",
 ]
 
-# Optional imports — don't fail if torch is missing
-try:
-    from panini_nlp.compression import MeruCompressor
-    __all__.append("MeruCompressor")
-except ImportError:
-    pass
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_name), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# ── Shared instances ─────────────────────────────────────────────────────────
+# Process-wide engines for scripts and services that do not need their own
+# configuration.  Direct construction keeps working and is unaffected.
+
+@lru_cache(maxsize=1)
+def get_sandhi_engine() -> "SandhiEngine":
+    """Return the shared ``SandhiEngine``."""
+    from panini_nlp.sandhi import SandhiEngine
+    return SandhiEngine()
+
+
+@lru_cache(maxsize=1)
+def get_morphological_analyzer() -> "MorphologicalAnalyzer":
+    """Return the shared ``MorphologicalAnalyzer``."""
+    from panini_nlp.morphology import MorphologicalAnalyzer
+    return MorphologicalAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def get_semantic_parser() -> "SemanticParser":
+    """Return the shared ``SemanticParser``."""
+    from panini_nlp.semantics import SemanticParser
+    return SemanticParser()
+
+
+@lru_cache(maxsize=1)
+def get_chandas_analyzer() -> "ChandasAnalyzer":
+    """Return the shared ``ChandasAnalyzer``."""
+    from panini_nlp.chandas import ChandasAnalyzer
+    return ChandasAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def get_samasa_analyzer() -> "SamasaAnalyzer":
+    """Return the shared ``SamasaAnalyzer``."""
+    from panini_nlp.samasa import SamasaAnalyzer
+    return SamasaAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def get_validator() -> "SanskritValidator":
+    """Return the shared ``SanskritValidator``."""
+    from panini_nlp.validator import SanskritValidator
+    return SanskritValidator()
+
+
+@lru_cache(maxsize=1)
+def get_meaning_engine() -> "SanskritMeaningEngine":
+    """Return the shared ``SanskritMeaningEngine`` (no translator)."""
+    from panini_nlp.meaning import SanskritMeaningEngine
+    return SanskritMeaningEngine(validator=get_validator())
@@ -0,0 +1,10 @@
+"""Helpers for supporting every Python version the package runs on."""
+
+import sys
+from typing import Dict
+
+__all__ = ["DATACLASS_SLOTS"]
+
+# ``@dataclass(slots=True)`` needs Python 3.10; older versions keep the
+# instance ``__dict__``.  Use as ``@dataclass(frozen=True, **DATACLASS_SLOTS)``.
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
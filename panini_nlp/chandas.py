@@ -11,41 +11,135 @@ Implements the algorithms from Piṅgala's Chandaḥśāstra (c. 200 BCE):
 Works on both IAST (Roman) and Devanāgarī input.
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+import re
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 __all__ = ["ChandasAnalyzer", "MeterResult"]
 
+# ── Character categories ─────────────────────────────────────────────────────
+# Each input character is mapped to a one-character category code with a
+# single ``str.translate`` call, so the quantizers dispatch on a handful of
+# codes instead of doing several set-membership tests per character.
+_CAT_OTHER = "\x00"
+_CAT_SHORT_V = "\x01"
+_CAT_LONG_V = "\x02"
+_CAT_SHORT_MATRA = "\x03"
+_CAT_LONG_MATRA = "\x04"
+_CAT_ANUSVARA = "\x05"
+_CAT_VIRAMA = "\x06"
+_CAT_CONSONANT = "\x07"
+# Pattern bytes: ASCII "0" (laghu) and "1" (guru).
+_LAGHU = 0x30
+_GURU = 0x31
+_CATEGORY_CODES = (
+    _CAT_OTHER, _CAT_SHORT_V, _CAT_LONG_V, _CAT_SHORT_MATRA,
+    _CAT_LONG_MATRA, _CAT_ANUSVARA, _CAT_VIRAMA, _CAT_CONSONANT,
+)
+
+# Saṃyoga tests, anchored just after a short vowel in a category string.
+# Devanāgarī: two or more consonants follow (virāmas inside the cluster
+# are skipped).  IAST: two or more consonants follow, or the consonant run
+# ends in anusvāra / visarga.
+_dev_samyoga_at = re.compile(
+    f"{_CAT_VIRAMA}*{_CAT_CONSONANT}{_CAT_VIRAMA}*{_CAT_CONSONANT}"
+).match
+_iast_guru_after = re.compile(
+    f"[^{_CAT_SHORT_V}{_CAT_LONG_V}{_CAT_ANUSVARA}]{{2}}"
+    f"|[^{_CAT_SHORT_V}{_CAT_LONG_V}{_CAT_ANUSVARA}]*{_CAT_ANUSVARA}"
+).match
+
+
+def _category_table(
+    groups: Iterable[Tuple[Iterable[str], str]], strip: str = ""
+) -> Tuple[Optional[str], ...]:
+    """Build a ``str.translate`` table mapping characters to category codes.
+
+    Later groups win when a character appears in more than one group.
+    Characters in *strip* are deleted, so cleaning and classification
+    happen in the same pass.  The code characters themselves map to
+    ``_CAT_OTHER`` so stray control characters in the input can never be
+    mistaken for a category.
+
+    The table is a dense tuple indexed by codepoint, built once at import;
+    ``str.translate`` indexes it directly, which is cheaper than a dict
+    lookup per character.  Codepoints past its end are left unchanged.
+    """
+    mapping: Dict[int, Optional[str]] = {ord(c): _CAT_OTHER for c in _CATEGORY_CODES}
+    for chars, code in groups:
+        for c in chars:
+            mapping[ord(c)] = code
+    for c in strip:
+        mapping[ord(c)] = None
+    return tuple(
+        mapping.get(cp, chr(cp)) for cp in range(max(mapping) + 1)
+    )
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # pragma: no cover - Python 3.9
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+# pada-level identification (quarter-verse), keyed by syllable count
+_PADA_METERS: Dict[int, str] = {
+    6: "Gāyatrī (6)",
+    7: "Uṣṇih (7)",
+    8: "Anuṣṭubh / Śloka (8)",
+    9: "Bṛhatī (9)",
+    11: "Triṣṭubh (11)",
+    12: "Jagatī (12)",
+}
+
+
+def _classify_length(n: int) -> str:
+    if n == 0:
+        return "Unknown"
+    return sys.intern(_PADA_METERS.get(n, f"Unclassified ({n} syllables)"))
+
+
+# Meter name for every syllable count a pada is realistically going to have.
+_METER_BY_LEN: Tuple[str, ...] = tuple(_classify_length(n) for n in range(64))
+
+
+@lru_cache(maxsize=256)
+def _meter_name(n: int) -> str:
+    """Interned meter name for a pada of *n* syllables."""
+    if n < len(_METER_BY_LEN):
+        return _METER_BY_LEN[n]
+    return _classify_length(n)
+
+
+@lru_cache(maxsize=16)
+def _prastara(n: int) -> Tuple[str, ...]:
+    """All 2^n patterns of length *n*, in prastāra order."""
+    # Built the way Piṅgala lays out the prastāra: each step doubles the
+    # table, prefixing laghu to the first half and guru to the second.
+    patterns = [""]
+    for _ in range(n):
+        patterns = ["0" + p for p in patterns] + ["1" + p for p in patterns]
+    return tuple(patterns)
+
 
 class MeterResult:
     """Result of a meter analysis."""
 
+    __slots__ = (
+        "text", "pattern", "syllable_count", "laghu_count",
+        "guru_count", "decimal", "meter_name",
+    )
+
     def __init__(self, text: str, pattern: str) -> None:
         self.text = text
         self.pattern = pattern      # "0110…" (0=laghu, 1=guru)
         self.syllable_count = len(pattern)
-        self.laghu_count = pattern.count("0")
-        self.guru_count = pattern.count("1")
         self.decimal = int(pattern, 2) if pattern else 0
-        self.meter_name = self._identify_meter()
-
-    def _identify_meter(self) -> str:
-        n = self.syllable_count
-        if n == 0:
-            return "Unknown"
-        # pada-level identification (quarter-verse)
-        if n == 6:
-            return "Gāyatrī (6)"
-        if n == 7:
-            return "Uṣṇih (7)"
-        if 7 <= n <= 8:
-            return "Anuṣṭubh / Śloka (8)"
-        if n == 9:
-            return "Bṛhatī (9)"
-        if n == 11:
-            return "Triṣṭubh (11)"
-        if n == 12:
-            return "Jagatī (12)"
-        return f"Unclassified ({n} syllables)"
+        self.guru_count = _popcount(self.decimal)
+        self.laghu_count = self.syllable_count - self.guru_count
+        self.meter_name = _meter_name(self.syllable_count)
 
     def __repr__(self) -> str:
         ratio = (
@@ -76,6 +170,12 @@ class ChandasAnalyzer:
          "A", "I", "U", "E", "O"]
     )
     _ANUSVARA_VISARGA = frozenset(["ṃ", "ḥ", "M", "H"])
+    # Anything that is not a vowel or anusvāra/visarga counts as a consonant.
+    _IAST_CATEGORIES = _category_table([
+        (_SHORT_VOWELS_IAST, _CAT_SHORT_V),
+        ((v for v in _LONG_VOWELS_IAST if len(v) == 1), _CAT_LONG_V),
+        (_ANUSVARA_VISARGA, _CAT_ANUSVARA),
+    ], strip=" |\n")
 
     # ── Devanāgarī classification ───────────────────────────────────────────
     _SHORT_V_DEV = frozenset("अइउऋऌ")
@@ -87,24 +187,66 @@ class ChandasAnalyzer:
     _DEV_CONSONANTS = frozenset(
         "कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह"
     )
-
-    def __init__(self) -> None:
-        pass
+    # Text is treated as Devanāgarī as soon as it contains one consonant or
+    # independent vowel; the regex scan stops at the first such letter.
+    _DEV_LETTER_RE = re.compile(
+        "[" + "".join(sorted(_DEV_CONSONANTS | _SHORT_V_DEV | _LONG_V_DEV)) + "]"
+    )
+    # ऌ is listed in both vowel sets; the long classification takes effect.
+    _DEV_CATEGORIES = _category_table([
+        (_SHORT_V_DEV, _CAT_SHORT_V),
+        (_LONG_V_DEV, _CAT_LONG_V),
+        (_SHORT_MATRA, _CAT_SHORT_MATRA),
+        (_LONG_MATRA, _CAT_LONG_MATRA),
+        (_ANUSVARA_DEV, _CAT_ANUSVARA),
+        (_VIRAMA, _CAT_VIRAMA),
+        (_DEV_CONSONANTS, _CAT_CONSONANT),
+    ], strip=" ।॥\n")
+
+    def __init__(self, cache_size: Optional[int] = 4096) -> None:
+        # Refrains and invocations recur across a document, so results are
+        # memoized per instance.  ``MeterResult`` objects are shared between
+        # callers and must be treated as read-only.
+        self._cache_size = cache_size
+        self.analyze = lru_cache(maxsize=cache_size)(self._analyze)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The memo wraps a bound method and cannot be pickled; copies and
+        # unpickled instances start with an empty one.
+        state = self.__dict__.copy()
+        del state["analyze"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.analyze = lru_cache(maxsize=self._cache_size)(self._analyze)
 
     # ── public API ───────────────────────────────────────────────────────────
 
     def analyze(self, text: str) -> MeterResult:
         """Analyze prosody of Sanskrit text → MeterResult."""
-        # Detect script
-        if any(c in self._DEV_CONSONANTS or c in self._SHORT_V_DEV or c in self._LONG_V_DEV for c in text):
+        # Replaced per instance by the memoized wrapper set up in __init__.
+        return self._analyze(text)
+
+    def clear_cache(self) -> None:
+        """Drop all memoized ``analyze`` results."""
+        self.analyze.cache_clear()
+
+    def _analyze(self, text: str) -> MeterResult:
+        if self._is_devanagari(text):
             pattern = self._quantize_devanagari(text)
         else:
             pattern = self._quantize_iast(text)
         return MeterResult(text, pattern)
 
+    @classmethod
+    def _is_devanagari(cls, text: str) -> bool:
+        return cls._DEV_LETTER_RE.search(text) is not None
+
     def prastara(self, n: int) -> List[str]:
         """Generate all 2^n binary meter patterns of length *n*."""
-        return [bin(i)[2:].zfill(n) for i in range(2 ** n)]
+        # Tables are memoized per length; callers get their own list.
+        return list(_prastara(n))
 
     def nashtam(self, index: int, length: int) -> str:
         """Naṣṭam: given an index, return the meter pattern (index → pattern)."""
@@ -117,130 +259,80 @@ class ChandasAnalyzer:
     # ── Devanāgarī quantizer ─────────────────────────────────────────────────
 
     def _quantize_devanagari(self, text: str) -> str:
-        clean = text.replace(" ", "").replace("।", "").replace("॥", "").replace("\n", "")
-        chars = list(clean)
-        bits: List[str] = []
+        cats = text.translate(self._DEV_CATEGORIES)
+        bits = bytearray()
         i = 0
-        n = len(chars)
+        n = len(cats)
 
         while i < n:
-            ch = chars[i]
+            cat = cats[i]
 
             # Independent vowel
-            if ch in self._SHORT_V_DEV or ch in self._LONG_V_DEV:
-                weight = "1" if ch in self._LONG_V_DEV else "0"
+            if cat == _CAT_SHORT_V or cat == _CAT_LONG_V:
+                weight = _GURU if cat == _CAT_LONG_V else _LAGHU
                 # Check for anusvāra / visarga after
-                if i + 1 < n and chars[i + 1] in self._ANUSVARA_DEV:
-                    weight = "1"
+                if i + 1 < n and cats[i + 1] == _CAT_ANUSVARA:
+                    weight = _GURU
                     i += 1
                 # Saṃyoga: short + 2+ consonants → guru
-                if weight == "0":
-                    weight = self._check_samyoga(chars, i, n)
+                if weight == _LAGHU and _dev_samyoga_at(cats, i + 1):
+                    weight = _GURU
                 bits.append(weight)
                 i += 1
                 continue
 
             # Consonant + mātrā
-            if ch in self._DEV_CONSONANTS:
+            if cat == _CAT_CONSONANT:
                 # Skip consonant clusters (virāma-joined)
-                while i + 1 < n and chars[i + 1] == self._VIRAMA:
+                while i + 1 < n and cats[i + 1] == _CAT_VIRAMA:
                     i += 2  # skip virāma + next consonant
                     if i >= n:
                         break
                 i += 1
                 if i >= n:
                     break
-                nxt = chars[i]
-                if nxt in self._SHORT_MATRA:
-                    weight = "0"
-                    if i + 1 < n and chars[i + 1] in self._ANUSVARA_DEV:
-                        weight = "1"
+                nxt = cats[i]
+                if nxt == _CAT_SHORT_MATRA:
+                    weight = _LAGHU
+                    if i + 1 < n and cats[i + 1] == _CAT_ANUSVARA:
+                        weight = _GURU
                         i += 1
-                    if weight == "0":
-                        weight = self._check_samyoga(chars, i, n)
+                    if weight == _LAGHU and _dev_samyoga_at(cats, i + 1):
+                        weight = _GURU
                     bits.append(weight)
                     i += 1
-                elif nxt in self._LONG_MATRA:
-                    bits.append("1")
-                    i += 1
-                elif nxt in self._ANUSVARA_DEV:
-                    bits.append("1")
+                elif nxt == _CAT_LONG_MATRA or nxt == _CAT_ANUSVARA:
+                    bits.append(_GURU)
                     i += 1
-                elif nxt == self._VIRAMA:
+                elif nxt == _CAT_VIRAMA:
                     # Consonant with halant — no vowel — skip
                     i += 1
                 else:
                     # Inherent 'a' (short)
-                    weight = self._check_samyoga(chars, i - 1, n)
-                    bits.append(weight)
+                    bits.append(_GURU if _dev_samyoga_at(cats, i) else _LAGHU)
                 continue
 
             # mātrā without preceding consonant (shouldn't happen normally)
-            if ch in self._SHORT_MATRA:
-                bits.append("0")
-                i += 1
-            elif ch in self._LONG_MATRA:
-                bits.append("1")
-                i += 1
-            else:
-                i += 1  # skip unknown
-
-        return "".join(bits)
-
-    def _check_samyoga(self, chars: list, pos: int, n: int) -> str:
-        """Check if a short vowel at *pos* is made guru by following conjunct."""
-        consonants = 0
-        j = pos + 1
-        while j < n:
-            c = chars[j]
-            if c == self._VIRAMA:
-                j += 1
-                continue
-            if c in self._DEV_CONSONANTS:
-                consonants += 1
-                j += 1
-            else:
-                break
-        return "1" if consonants >= 2 else "0"
+            if cat == _CAT_SHORT_MATRA:
+                bits.append(_LAGHU)
+            elif cat == _CAT_LONG_MATRA:
+                bits.append(_GURU)
+            i += 1  # unknown characters are skipped
+
+        return bits.decode("ascii")
 
     # ── IAST quantizer ───────────────────────────────────────────────────────
 
     def _quantize_iast(self, text: str) -> str:
-        clean = text.replace(" ", "").replace("|", "").replace("\n", "")
-        bits: List[str] = []
-        i = 0
-        n = len(clean)
-
-        while i < n:
-            ch = clean[i]
-            is_short = ch in self._SHORT_VOWELS_IAST
-            is_long = ch in self._LONG_VOWELS_IAST
-
-            if is_short or is_long:
-                weight = "1" if is_long else "0"
-
-                # Anusvāra / visarga → guru
-                if i + 1 < n and clean[i + 1] in self._ANUSVARA_VISARGA:
-                    weight = "1"
-
-                # Saṃyoga: short vowel + 2+ consonants → guru
-                if weight == "0":
-                    cons = 0
-                    j = i + 1
-                    while j < n:
-                        if clean[j] in self._ANUSVARA_VISARGA:
-                            weight = "1"
-                            break
-                        if clean[j] not in self._SHORT_VOWELS_IAST and clean[j] not in self._LONG_VOWELS_IAST:
-                            cons += 1
-                            j += 1
-                        else:
-                            break
-                    if cons > 1:
-                        weight = "1"
-
-                bits.append(weight)
-
-            i += 1
-
-        return "".join(bits)
+        cats = text.translate(self._IAST_CATEGORIES)
+        bits = bytearray()
+
+        for i, cat in enumerate(cats):
+            if cat == _CAT_LONG_V:
+                bits.append(_GURU)
+            elif cat == _CAT_SHORT_V:
+                # Saṃyoga: short vowel + 2+ consonants → guru;
+                # a following anusvāra / visarga also makes it guru.
+                bits.append(_GURU if _iast_guru_after(cats, i + 1) else _LAGHU)
+
+        return bits.decode("ascii")
@@ -2,14 +2,28 @@
 Piṅgala Compression Engine — .meru format.
 
 Implements "Sūtra Compression": dictionary-encode repetitive string
-fields, pack with msgpack, and compress with zlib.
+fields, pack with msgpack, and compress with Zstandard (zlib when
+``zstandard`` is not installed).
 
 Requires: msgpack (``pip install msgpack``).
+Optional: zstandard (``pip install zstandard``) for faster, smaller blobs;
+orjson (``pip install orjson``) for a faster JSON baseline in compare_sizes.
+
+A Zstandard dictionary trained on .meru payloads of the bundled corpora
+ships as ``panini_nlp/data/meru.zdict``; it primes the compressor so
+small payloads compress well.  Regenerate it with::
+
+    python -m panini_nlp.compression train-dict -o panini_nlp/data/meru.zdict
 """
 
-from typing import Any, Dict, List, Optional
+from array import array
+from functools import lru_cache
+from importlib.resources import files
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import argparse
 import json
 import os
+import sys
 import zlib
 
 __all__ = ["MeruCompressor"]
@@ -20,6 +34,51 @@ try:
 except ImportError:
     _HAS_MSGPACK = False
 
+try:
+    import zstandard
+    _HAS_ZSTD = True
+except ImportError:
+    _HAS_ZSTD = False
+
+# compare_sizes measures compact UTF-8 JSON; orjson produces it much faster
+# when it is installed.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _json_bytes(data: Any) -> bytes:
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # e.g. ints beyond 64 bits; let json handle them
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Zstandard blobs are prefixed with this tag; anything else is read as a
+# legacy zlib stream.  The frame header records which dictionary, if any,
+# the payload was compressed with.
+_ZSTD_MAGIC = b"MRU1"
+_DEFAULT_LEVEL = 15
+_DICT_RESOURCE = "meru.zdict"
+
+_FORMAT_V1 = "meru_sutra_v1"
+_FORMAT_V2 = "meru_sutra_v2"
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+@lru_cache(maxsize=1)
+def _load_dictionary() -> Optional["zstandard.ZstdCompressionDict"]:
+    """Load the bundled Zstandard dictionary once per process."""
+    if not _HAS_ZSTD:
+        return None
+    path = files("panini_nlp.data").joinpath(_DICT_RESOURCE)
+    if not path.is_file():
+        return None
+    return zstandard.ZstdCompressionDict(path.read_bytes())
+
 
 class MeruCompressor:
     """
@@ -29,10 +88,22 @@ class MeruCompressor:
       1. **DNA extraction** — find string columns whose unique-value count
          is less than the row count (dictionary-encoding candidates).
       2. **Tokenize** — replace string values with integer indices.
-      3. **Pack** — serialize with msgpack (binary, dense).
-      4. **Compress** — zlib level-9 for maximum compression.
+      3. **Pack** — lay the table out column by column: coded columns and
+         all-int / all-float columns become little-endian typed arrays,
+         anything else stays a list; serialize with msgpack.
+      4. **Compress** — Zstandard (default level 15), falling back to
+         zlib level-9 when ``zstandard`` is not installed.
 
-    Decompression reverses every step losslessly.
+    Decompression reverses every step losslessly and still reads blobs
+    written with zlib by earlier versions.
+
+    Parameters
+    ----------
+    level : int
+        Zstandard compression level (default 15).
+    use_dictionary : bool
+        Prime Zstandard with the bundled dictionary (default True).  Blobs
+        written with the dictionary need it to be decompressed.
 
     >>> comp = MeruCompressor()
     >>> data = [{"state": "AP", "city": "Hyd"}, {"state": "AP", "city": "Viz"}]
@@ -41,71 +112,122 @@ class MeruCompressor:
     True
     """
 
-    def __init__(self) -> None:
+    def __init__(self, level: int = _DEFAULT_LEVEL, use_dictionary: bool = True) -> None:
         if not _HAS_MSGPACK:
             raise ImportError(
                 "msgpack is required for compression.  "
                 "Install it with:  pip install msgpack"
             )
+        self._cctx = None
+        self._dctx = None
+        self._dict_id = 0
+        if _HAS_ZSTD:
+            dict_data = _load_dictionary() if use_dictionary else None
+            if dict_data is not None:
+                self._dict_id = dict_data.dict_id()
+            # Contexts are reused across calls rather than rebuilt per blob.
+            self._cctx = zstandard.ZstdCompressor(level=level, dict_data=dict_data)
+            self._dctx = zstandard.ZstdDecompressor(dict_data=dict_data)
 
     # ── compress ─────────────────────────────────────────────────────────────
 
-    def compress(self, data: List[Dict[str, Any]], dataset_name: str = "data") -> bytes:
-        """Compress a list of flat dicts into a .meru binary blob."""
-        if not data:
-            return self._pack_and_deflate({
-                "meta": {"type": "meru_sutra_v1", "name": dataset_name},
-                "schema": [],
-                "dna": {},
-                "stream": [],
-            })
+    def compress(
+        self,
+        data: List[Dict[str, Any]],
+        dataset_name: str = "data",
+        sort_vocab: bool = False,
+    ) -> bytes:
+        """Compress a list of flat dicts into a .meru binary blob.
 
-        keys = list(data[0].keys())
+        Vocabularies keep first-seen order; pass ``sort_vocab=True`` for a
+        blob that does not depend on row order.
+        """
+        return self._pack_and_deflate(self._build_seed(data, dataset_name, sort_vocab))
 
-        # 1 — Identify dictionary-encoding candidates (string columns)
-        vocab_registry: Dict[str, Dict[str, int]] = {}
-        reverse_vocab: Dict[str, List[str]] = {}
+    @staticmethod
+    def _build_seed(
+        data: List[Dict[str, Any]],
+        dataset_name: str,
+        sort_vocab: bool = False,
+    ) -> Dict[str, Any]:
+        """Dictionary-encode *data* into the columnar structure that gets packed."""
+        keys = list(data[0].keys()) if data else []
 
+        reverse_vocab: Dict[str, List[str]] = {}
+        types: Dict[str, str] = {}
+        columns: Dict[str, Any] = {}
         for k in keys:
-            sample = data[0].get(k)
-            if not isinstance(sample, str):
-                continue
-            unique = set(row.get(k, "") for row in data)
-            if len(unique) < len(data):
-                sorted_vals = sorted(unique)
-                vocab_registry[k] = {v: i for i, v in enumerate(sorted_vals)}
-                reverse_vocab[k] = sorted_vals
-
-        # 2 — Tokenize
-        stream: List[List[Any]] = []
-        for row in data:
-            new_row: List[Any] = []
-            for k in keys:
-                val = row.get(k)
-                if k in vocab_registry:
-                    new_row.append(vocab_registry[k].get(val, 0))  # type: ignore[arg-type]
+            if isinstance(data[0].get(k), str):
+                # One pass assigns codes in first-seen order; whether the
+                # column is worth coding is decided afterwards.
+                index: Dict[str, int] = {}
+                assign = index.setdefault
+                col = [assign(row.get(k, ""), len(index)) for row in data]
+                if len(index) < len(data):
+                    vocab = list(index)
+                    if sort_vocab:
+                        vocab.sort()
+                        rank = [0] * len(vocab)
+                        for code, v in enumerate(vocab):
+                            rank[index[v]] = code
+                        col = list(map(rank.__getitem__, col))
+                    reverse_vocab[k] = vocab
                 else:
-                    new_row.append(val)
-            stream.append(new_row)
+                    # Every value was distinct: store the column uncoded.
+                    # Missing keys decode as None, not "".
+                    col = [row.get(k) for row in data]
+            else:
+                col = [row.get(k) for row in data]
+            typecode = _array_typecode(col)
+            if typecode is None:
+                columns[k] = col
+            else:
+                types[k] = typecode
+                columns[k] = _pack_array(typecode, col)
 
-        seed = {
-            "meta": {"type": "meru_sutra_v1", "name": dataset_name},
+        return {
+            "meta": {"type": _FORMAT_V2, "name": dataset_name},
             "schema": keys,
             "dna": reverse_vocab,
-            "stream": stream,
+            "rows": len(data),
+            "types": types,
+            "columns": columns,
         }
-        return self._pack_and_deflate(seed)
 
     # ── decompress ───────────────────────────────────────────────────────────
 
     def decompress(self, meru_bytes: bytes) -> List[Dict[str, Any]]:
         """Decompress a .meru blob back to a list of dicts."""
-        try:
-            packed = zlib.decompress(meru_bytes)
-        except zlib.error:
+        packed = self._inflate(meru_bytes)
+        if packed is None:
             return []
 
         seed = msgpack.unpackb(packed, raw=False)
+        if seed["meta"].get("type") == _FORMAT_V1:
+            return self._decode_rows(seed)
+        return self._decode_columns(seed)
+
+    @staticmethod
+    def _decode_columns(seed: Dict[str, Any]) -> List[Dict[str, Any]]:
+        keys: List[str] = seed["schema"]
+        if not keys:
+            return [{} for _ in range(seed["rows"])]
+        dna: Dict[str, List[str]] = seed["dna"]
+        types: Dict[str, str] = seed["types"]
+
+        cols: List[List[Any]] = []
+        for k in keys:
+            col = seed["columns"][k]
+            if k in types:
+                col = _unpack_array(types[k], col)
+            if k in dna:
+                col = list(map(dna[k].__getitem__, col))
+            cols.append(col)
+        return [dict(zip(keys, row)) for row in zip(*cols)]
+
+    @staticmethod
+    def _decode_rows(seed: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Decode the row-major ``meru_sutra_v1`` layout."""
         keys: List[str] = seed["schema"]
         dna: Dict[str, List[str]] = seed["dna"]
         stream: List[List[Any]] = seed["stream"]
@@ -139,17 +261,53 @@ class MeruCompressor:
 
     # ── internals ────────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _pack_and_deflate(obj: Any) -> bytes:
+    def _inflate(self, meru_bytes: bytes) -> Optional[bytes]:
+        """Undo the compression step; ``None`` if the blob is corrupt."""
+        if meru_bytes[:len(_ZSTD_MAGIC)] != _ZSTD_MAGIC:
+            try:
+                return zlib.decompress(meru_bytes)
+            except zlib.error:
+                return None
+
+        if self._dctx is None:
+            raise ImportError(
+                "This .meru blob is Zstandard-compressed.  "
+                "Install it with:  pip install zstandard"
+            )
+        frame = meru_bytes[len(_ZSTD_MAGIC):]
+        try:
+            dict_id = zstandard.get_frame_parameters(frame).dict_id
+        except zstandard.ZstdError:
+            return None
+        if dict_id and dict_id != self._dict_id:
+            raise ValueError(
+                f"This .meru blob needs Zstandard dictionary {dict_id}, "
+                f"but the compressor has {self._dict_id or 'none'} loaded."
+            )
+        try:
+            return self._dctx.decompress(frame)
+        except zstandard.ZstdError:
+            return None
+
+    def _pack_and_deflate(self, obj: Any) -> bytes:
         packed = msgpack.packb(obj, use_bin_type=True)
+        if self._cctx is not None:
+            return _ZSTD_MAGIC + self._cctx.compress(packed)
         return zlib.compress(packed, level=9)
 
     # ── comparison helpers ───────────────────────────────────────────────────
 
     @staticmethod
     def compare_sizes(data: List[Dict[str, Any]], meru_bytes: bytes) -> Dict[str, Any]:
-        """Return a dict comparing JSON vs .meru sizes and compression ratio."""
-        json_size = len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        """Return a dict comparing JSON vs .meru sizes and compression ratio.
+
+        The JSON baseline is compact (no spaces after ``,`` and ``:``), so
+        it is a few percent smaller than the default ``json.dumps`` output
+        used by earlier releases.  orjson writes NaN/Infinity as ``null``
+        and may format floats differently, so the size can vary slightly
+        depending on whether it is installed.
+        """
+        json_size = len(_json_bytes(data))
         meru_size = len(meru_bytes)
         return {
             "json_bytes": json_size,
@@ -157,3 +315,105 @@ class MeruCompressor:
             "ratio": round(meru_size / json_size, 4) if json_size else 0,
             "savings_pct": round((1 - meru_size / json_size) * 100, 2) if json_size else 0,
         }
+
+
+# ── typed columns ────────────────────────────────────────────────────────────
+
+
+def _array_typecode(col: List[Any]) -> Optional[str]:
+    """Pick an ``array`` typecode that holds *col* exactly, or ``None``."""
+    if not col:
+        return None
+    kinds = set(map(type, col))
+    if kinds == {float}:
+        return "d"
+    if kinds != {int}:
+        return None
+    lo, hi = min(col), max(col)
+    if lo >= 0:
+        for typecode in ("B", "H", "I"):
+            if hi < 1 << (8 * array(typecode).itemsize):
+                return typecode
+    if _INT64_MIN <= lo and hi <= _INT64_MAX:
+        return "q"
+    return None
+
+
+def _pack_array(typecode: str, col: List[Any]) -> bytes:
+    arr = array(typecode, col)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _unpack_array(typecode: str, raw: bytes) -> List[Any]:
+    arr = array(typecode)
+    arr.frombytes(raw)
+    if sys.byteorder == "big":
+        arr.byteswap()
+    return arr.tolist()
+
+
+# ── dictionary training ──────────────────────────────────────────────────────
+
+
+def _corpus_samples() -> Iterator[bytes]:
+    """Packed .meru payloads built from the bundled corpora, in varied sizes."""
+    from panini_nlp.corpus import AshtadhyayiCorpus, DhatupathaCorpus
+
+    tables = [
+        [{"id": e.id, "id_ascii": e.id_ascii, "text": e.text}
+         for e in AshtadhyayiCorpus().all()],
+        [{"code": e.code, "code_ascii": e.code_ascii, "dhatu": e.dhatu,
+          "meaning": e.meaning} for e in DhatupathaCorpus().all()],
+    ]
+    for rows in tables:
+        for size in (4, 16, 64, 256):
+            for start in range(0, len(rows), size):
+                seed = MeruCompressor._build_seed(rows[start:start + size], "sample")
+                yield msgpack.packb(seed, use_bin_type=True)
+
+
+def _read_sample(path: str) -> bytes:
+    """Return the packed payload of a .meru file (or the raw file bytes)."""
+    with open(path, "rb") as f:
+        blob = f.read()
+    packed = MeruCompressor(use_dictionary=False)._inflate(blob)
+    return blob if packed is None else packed
+
+
+def _main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m panini_nlp.compression")
+    commands = parser.add_subparsers(dest="command", required=True)
+    train = commands.add_parser(
+        "train-dict",
+        help="train a Zstandard dictionary for .meru payloads",
+    )
+    train.add_argument(
+        "samples", nargs="*",
+        help=".meru files to train on (default: the bundled corpora)",
+    )
+    train.add_argument("-o", "--output", required=True)
+    train.add_argument("--size", type=int, default=64 * 1024)
+    train.add_argument("--level", type=int, default=_DEFAULT_LEVEL)
+    args = parser.parse_args(argv)
+
+    if not (_HAS_MSGPACK and _HAS_ZSTD):
+        parser.error("train-dict needs msgpack and zstandard installed")
+
+    if args.samples:
+        samples = [_read_sample(p) for p in args.samples]
+    else:
+        samples = list(_corpus_samples())
+    # Train at the level used for compression so the tuned parameters match.
+    dict_data = zstandard.train_dictionary(args.size, samples, level=args.level)
+    with open(args.output, "wb") as f:
+        f.write(dict_data.as_bytes())
+    print(
+        f"Wrote {args.output}: {len(dict_data)} bytes, "
+        f"dict id {dict_data.dict_id()}, {len(samples)} samples"
+    )
+
+
+if __name__ == "__main__":
+    _main()
@@ -6,11 +6,15 @@ It provides structured access to the full textual corpus so users can
 lookup/search every bundled sūtra and dhātu from Python.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from functools import lru_cache
-from importlib.resources import files
+from importlib.resources import as_file, files
+import mmap
+import os
 import re
-from typing import List, Optional
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 __all__ = [
     "SutraEntry",
@@ -22,6 +26,9 @@ __all__ = [
 
 _DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
 
+_SUTRA_RE = re.compile(r"^([०-९0-9]+\.[०-९0-9]+\.[०-९0-9]+)\s+(.+?)\s*।+$")
+_DHATU_RE = re.compile(r"^([०-९0-9]+\.[०-९0-9]+)\s+(.+)$")
+
 
 @dataclass(frozen=True)
 class SutraEntry:
@@ -44,19 +51,29 @@ def _to_ascii_digits(value: str) -> str:
     return value.translate(_DEVANAGARI_DIGITS)
 
 
-@lru_cache(maxsize=1)
-def _load_ashtadhyayi_entries() -> List[SutraEntry]:
-    path = files("panini_nlp.data").joinpath("Ashtadhyayi.txt")
-    content = path.read_text(encoding="utf-8")
+def _iter_data_lines(name: str) -> Iterator[str]:
+    """Yield the lines of a bundled data file, decoding one line at a time.
+
+    The file is memory-mapped, so the whole text is never held as one str.
+    """
+    with as_file(files("panini_nlp.data").joinpath(name)) as path:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for raw in iter(mm.readline, b""):
+                    yield raw.decode("utf-8")
 
+
+@lru_cache(maxsize=1)
+def _load_ashtadhyayi_entries() -> Tuple[SutraEntry, ...]:
     entries: List[SutraEntry] = []
-    pattern = re.compile(r"^([०-९0-9]+\.[०-९0-9]+\.[०-९0-9]+)\s+(.+?)\s*।+$")
 
-    for raw_line in content.splitlines():
+    for raw_line in _iter_data_lines("Ashtadhyayi.txt"):
         line = raw_line.strip()
         if not line or line.startswith("॥"):
             continue
-        match = pattern.match(line)
+        match = _SUTRA_RE.match(line)
         if not match:
             continue
 
@@ -71,25 +88,21 @@ def _load_ashtadhyayi_entries() -> List[SutraEntry]:
             )
         )
 
-    return entries
+    return tuple(entries)
 
 
 @lru_cache(maxsize=1)
-def _load_dhatupatha_entries() -> List[DhatuEntry]:
-    path = files("panini_nlp.data").joinpath("Dhatupatha.txt")
-    content = path.read_text(encoding="utf-8")
-
+def _load_dhatupatha_entries() -> Tuple[DhatuEntry, ...]:
     entries: List[DhatuEntry] = []
-    numbered_pattern = re.compile(r"^([०-९0-9]+\.[०-९0-9]+)\s+(.+)$")
 
-    for raw_line in content.splitlines():
+    for raw_line in _iter_data_lines("Dhatupatha.txt"):
         line = raw_line.strip()
         if not line:
             continue
         if line.startswith("अथ ") or line.startswith("॥"):
             continue
 
-        match = numbered_pattern.match(line)
+        match = _DHATU_RE.match(line)
         if not match:
             continue
 
@@ -102,7 +115,8 @@ def _load_dhatupatha_entries() -> List[DhatuEntry]:
 
         parts = tail.split(maxsplit=1)
         dhatu = parts[0].strip()
-        meaning = parts[1].strip() if len(parts) > 1 else ""
+        # Glosses repeat heavily (गतौ, इत्येके, ...); keep one copy of each.
+        meaning = sys.intern(parts[1].strip()) if len(parts) > 1 else ""
         entries.append(
             DhatuEntry(
                 code=code,
@@ -113,7 +127,101 @@ def _load_dhatupatha_entries() -> List[DhatuEntry]:
             )
         )
 
-    return entries
+    return tuple(entries)
+
+
+@lru_cache(maxsize=1)
+def _ashtadhyayi_index() -> Dict[str, SutraEntry]:
+    # ASCII ids cover Devanāgarī ids too; iterate in reverse so a repeated
+    # id resolves to its first occurrence.
+    return {e.id_ascii: e for e in reversed(_load_ashtadhyayi_entries())}
+
+
+@lru_cache(maxsize=1)
+def _dhatupatha_index() -> Dict[str, DhatuEntry]:
+    return {e.code_ascii: e for e in reversed(_load_dhatupatha_entries())}
+
+
+@lru_cache(maxsize=1)
+def _ashtadhyayi_haystacks() -> Tuple[str, ...]:
+    return tuple(
+        f"{e.id} {e.id_ascii} {e.text}".lower()
+        for e in _load_ashtadhyayi_entries()
+    )
+
+
+@lru_cache(maxsize=1)
+def _dhatupatha_haystacks() -> Tuple[str, ...]:
+    return tuple(
+        f"{e.code} {e.code_ascii} {e.dhatu} {e.meaning}".lower()
+        for e in _load_dhatupatha_entries()
+    )
+
+
+@lru_cache(maxsize=1)
+def _dhatupatha_roots() -> Tuple[str, ...]:
+    return tuple(e.dhatu for e in _load_dhatupatha_entries())
+
+
+# Haystacks joined into one buffer so a needle is found with repeated
+# str.find calls instead of a Python-level loop over entries.  Queries are
+# stripped, so they cannot contain the separator or match across entries.
+_HAY_SEP = "\x00"
+
+
+def _join_haystacks(haystacks: Sequence[str]) -> Tuple[str, List[int]]:
+    starts: List[int] = []
+    offset = 0
+    for hay in haystacks:
+        starts.append(offset)
+        offset += len(hay) + len(_HAY_SEP)
+    return _HAY_SEP.join(haystacks), starts
+
+
+@lru_cache(maxsize=1)
+def _ashtadhyayi_blob() -> Tuple[str, List[int]]:
+    return _join_haystacks(_ashtadhyayi_haystacks())
+
+
+@lru_cache(maxsize=1)
+def _dhatupatha_blob() -> Tuple[str, List[int]]:
+    return _join_haystacks(_dhatupatha_haystacks())
+
+
+def _scan(blob: str, starts: List[int], needle: str, limit: int) -> List[int]:
+    """Indices of the first *limit* haystacks in *blob* containing *needle*.
+
+    The limit is checked after each hit, exactly like the ``search`` loops,
+    so ``search_many`` agrees with ``search`` even for ``limit <= 0``.
+    """
+    hits: List[int] = []
+    pos = blob.find(needle)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        hits.append(i)
+        if len(hits) >= limit or i + 1 == len(starts):
+            break
+        pos = blob.find(needle, starts[i + 1])
+    return hits
+
+
+def _search_many(
+    blob: Tuple[str, List[int]],
+    entries: Sequence,
+    queries: Iterable[str],
+    limit: int,
+) -> Dict[str, list]:
+    text, starts = blob
+    results: Dict[str, list] = {}
+    for query in queries:
+        if query in results:
+            continue
+        needle = query.strip().lower()
+        if not needle or _HAY_SEP in needle:
+            results[query] = []
+            continue
+        results[query] = [entries[i] for i in _scan(text, starts, needle, limit)]
+    return results
 
 
 class AshtadhyayiCorpus:
@@ -121,21 +229,19 @@ class AshtadhyayiCorpus:
 
     def __init__(self) -> None:
         self._entries = _load_ashtadhyayi_entries()
+        self._by_id = _ashtadhyayi_index()
+        self._haystacks = _ashtadhyayi_haystacks()
 
     @property
     def count(self) -> int:
         return len(self._entries)
 
-    def all(self) -> List[SutraEntry]:
-        return list(self._entries)
+    def all(self) -> Sequence[SutraEntry]:
+        """Every sūtra in order, as a shared read-only tuple (not a copy)."""
+        return self._entries
 
     def get(self, sutra_id: str) -> Optional[SutraEntry]:
-        target = sutra_id.strip()
-        target_ascii = _to_ascii_digits(target)
-        for entry in self._entries:
-            if entry.id == target or entry.id_ascii == target_ascii:
-                return entry
-        return None
+        return self._by_id.get(_to_ascii_digits(sutra_id.strip()))
 
     def search(self, query: str, limit: int = 20) -> List[SutraEntry]:
         needle = query.strip().lower()
@@ -143,35 +249,39 @@ class AshtadhyayiCorpus:
             return []
 
         found: List[SutraEntry] = []
-        for entry in self._entries:
-            hay = f"{entry.id} {entry.id_ascii} {entry.text}".lower()
+        for i, hay in enumerate(self._haystacks):
             if needle in hay:
-                found.append(entry)
+                found.append(self._entries[i])
                 if len(found) >= limit:
                     break
         return found
 
+    def search_many(
+        self, queries: Iterable[str], limit: int = 20
+    ) -> Dict[str, List[SutraEntry]]:
+        """Run :meth:`search` for each query; results are keyed by query."""
+        return _search_many(_ashtadhyayi_blob(), self._entries, queries, limit)
+
 
 class DhatupathaCorpus:
     """Structured access to all bundled Dhātupāṭha entries."""
 
     def __init__(self) -> None:
         self._entries = _load_dhatupatha_entries()
+        self._by_code = _dhatupatha_index()
+        self._haystacks = _dhatupatha_haystacks()
+        self._dhatus = _dhatupatha_roots()
 
     @property
     def count(self) -> int:
         return len(self._entries)
 
-    def all(self) -> List[DhatuEntry]:
-        return list(self._entries)
+    def all(self) -> Sequence[DhatuEntry]:
+        """Every dhātu entry in order, as a shared read-only tuple (not a copy)."""
+        return self._entries
 
     def get(self, code: str) -> Optional[DhatuEntry]:
-        target = code.strip()
-        target_ascii = _to_ascii_digits(target)
-        for entry in self._entries:
-            if entry.code == target or entry.code_ascii == target_ascii:
-                return entry
-        return None
+        return self._by_code.get(_to_ascii_digits(code.strip()))
 
     def search(self, query: str, limit: int = 20) -> List[DhatuEntry]:
         needle = query.strip().lower()
@@ -179,30 +289,39 @@ class DhatupathaCorpus:
             return []
 
         found: List[DhatuEntry] = []
-        for entry in self._entries:
-            hay = f"{entry.code} {entry.code_ascii} {entry.dhatu} {entry.meaning}".lower()
+        for i, hay in enumerate(self._haystacks):
             if needle in hay:
-                found.append(entry)
+                found.append(self._entries[i])
                 if len(found) >= limit:
                     break
         return found
 
+    def search_many(
+        self, queries: Iterable[str], limit: int = 20
+    ) -> Dict[str, List[DhatuEntry]]:
+        """Run :meth:`search` for each query; results are keyed by query."""
+        return _search_many(_dhatupatha_blob(), self._entries, queries, limit)
+
     def find_roots(self, surface: str, limit: int = 20) -> List[DhatuEntry]:
         needle = surface.strip()
         if not needle:
             return []
 
         found: List[DhatuEntry] = []
-        for entry in self._entries:
-            if needle in entry.dhatu:
-                found.append(entry)
+        for i, dhatu in enumerate(self._dhatus):
+            if needle in dhatu:
+                found.append(self._entries[i])
                 if len(found) >= limit:
                     break
         return found
 
 
 class SanskritCorpus:
-    """Convenience wrapper exposing both Aṣṭādhyāyī and Dhātupāṭha."""
+    """Convenience wrapper exposing both Aṣṭādhyāyī and Dhātupāṭha.
+
+    Parsed entries and their indices are module-level singletons, so any
+    number of corpus objects share one copy of the data.
+    """
 
     def __init__(self) -> None:
         self.ashtadhyayi = AshtadhyayiCorpus()
@@ -6,12 +6,18 @@ Two encoders are provided:
   - UniversalFeatureEncoder (48-dim): UD (Universal Dependencies) tags
 """
 
+from array import array
 import hashlib
 import random
-from typing import Any, Dict, List
+import struct
+from typing import Any, Dict, List, MutableSequence, Sequence
 
 __all__ = ["PaniniFeatureEncoder", "UniversalFeatureEncoder"]
 
+# The semantic hash reads an MD5 digest as four little-endian 32-bit lanes.
+_HASH_LANES = struct.Struct("<4I").unpack
+_INV_2_32 = 1.0 / (1 << 32)
+
 
 class PaniniFeatureEncoder:
     """
@@ -27,6 +33,14 @@ class PaniniFeatureEncoder:
         [25..28]  liṅga one-hot      (M/F/N + unknown)
         [29..32]  puruṣa one-hot     (1st/2nd/3rd + unknown)
         [33..36]  semantic hash      (4 deterministic floats)
+
+    Parameters
+    ----------
+    legacy_hash : bool
+        Derive the semantic-hash floats from an MD5-seeded ``random.Random``
+        (default True).  The shipped pre-trained weights were trained on
+        these features.  Pass False to slice the digest directly, which is
+        faster but only suitable for models trained that way.
     """
 
     TYPE_MAP = {
@@ -45,6 +59,9 @@ class PaniniFeatureEncoder:
     LINGA_MAP = {"Masculine": 0, "Feminine": 1, "Neuter": 2}
     PURUSHA_MAP = {"1st": 0, "2nd": 1, "3rd": 2}
 
+    def __init__(self, legacy_hash: bool = True) -> None:
+        self.legacy_hash = legacy_hash
+
     @property
     def feature_dim(self) -> int:
         return 37
@@ -52,47 +69,68 @@ class PaniniFeatureEncoder:
     def encode(self, node_data: Dict[str, Any]) -> List[float]:
         """Return a 37-float feature list for *node_data*."""
         features = [0.0] * 37
+        self._fill(features, 0, node_data)
+        return features
+
+    def encode_batch(self, nodes: Sequence[Dict[str, Any]]) -> "array[float]":
+        """Encode *nodes* into one flat, row-major float32 buffer.
+
+        The buffer holds ``len(nodes) * 37`` values and supports the buffer
+        protocol, so it converts without copying, e.g.
+        ``torch.frombuffer(buf, dtype=torch.float32).view(-1, 37)``.
+        """
+        out = array("f", bytes(4 * 37 * len(nodes)))
+        for row, node_data in enumerate(nodes):
+            self._fill(out, 37 * row, node_data)
+        return out
+
+    def _fill(
+        self, out: MutableSequence[float], base: int, node_data: Dict[str, Any]
+    ) -> None:
+        """Write the features of *node_data* into ``out[base:base + 37]``."""
         meta = node_data.get("metadata", {})
 
         # Node type (9 dim)
         ntype = node_data.get("type", "ENTITY")
         t_idx = self.TYPE_MAP.get(ntype, 3)
         if t_idx < 9:
-            features[t_idx] = 1.0
+            out[base + t_idx] = 1.0
 
         # Category (3 dim)
         cat = meta.get("category", "Avyaya")
         c_idx = self.CATEGORY_MAP.get(cat, 2)
-        features[9 + c_idx] = 1.0
+        out[base + 9 + c_idx] = 1.0
 
         # Vibhakti (9 dim — 8 cases + unknown)
         vib = meta.get("vibhakti") or meta.get("case")
         v_idx = self.VIBHAKTI_MAP.get(vib, 8) if vib else 8
-        features[12 + v_idx] = 1.0
+        out[base + 12 + v_idx] = 1.0
 
         # Vacana (4 dim)
         vac = meta.get("vacana") or meta.get("number")
         vc_idx = self.VACANA_MAP.get(vac, 3) if vac else 3
-        features[21 + vc_idx] = 1.0
+        out[base + 21 + vc_idx] = 1.0
 
         # Liṅga (4 dim)
         lin = meta.get("linga") or meta.get("gender")
         l_idx = self.LINGA_MAP.get(lin, 3) if lin else 3
-        features[25 + l_idx] = 1.0
+        out[base + 25 + l_idx] = 1.0
 
         # Puruṣa (4 dim)
         pur = meta.get("purusha") or meta.get("person")
         p_idx = self.PURUSHA_MAP.get(pur, 3) if pur else 3
-        features[29 + p_idx] = 1.0
+        out[base + 29 + p_idx] = 1.0
 
         # Semantic hash (4 dim — deterministic from label)
         label = node_data.get("label", "")
-        h = int(hashlib.md5(label.encode()).hexdigest(), 16)
-        rng = random.Random(h)
-        for i in range(4):
-            features[33 + i] = rng.random()
-
-        return features
+        digest = hashlib.md5(label.encode()).digest()
+        if self.legacy_hash:
+            rng = random.Random(int.from_bytes(digest, "big"))
+            for i in range(4):
+                out[base + 33 + i] = rng.random()
+        else:
+            for i, lane in enumerate(_HASH_LANES(digest)):
+                out[base + 33 + i] = lane * _INV_2_32
 
 
 class UniversalFeatureEncoder:
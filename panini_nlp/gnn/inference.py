@@ -7,7 +7,7 @@ Handles model loading, device management, and provides a single
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 __all__ = ["GNNInference"]
 
@@ -29,6 +29,11 @@ class GNNInference:
         Directory containing ``.pth`` weight files.
     device : str
         ``"cpu"`` or ``"cuda"`` (default ``"cpu"``).
+    compile_models : bool
+        Wrap loaded models in ``torch.compile`` (default False).  Models are
+        warmed up at load time and stay eager if that fails; a compiled
+        model that later fails (e.g. recompiling for a new input shape) is
+        replaced by its eager original for the rest of the session.
 
     Example
     -------
@@ -41,11 +46,13 @@ class GNNInference:
         self,
         models_dir: Optional[str] = None,
         device: str = "cpu",
+        compile_models: bool = False,
     ) -> None:
         if not _HAS_TORCH:
             raise ImportError("PyTorch is required.  pip install torch")
 
         self.device = torch.device(device)
+        self.compile_models = compile_models
 
         # Default: look for models/ dir next to this file
         if models_dir is None:
@@ -59,6 +66,14 @@ class GNNInference:
         self._trigger_model = None
         self._conflict_model = None
 
+        # The trigger and conflict input spaces are tiny (11×11 and 6×6 by
+        # default), so every pair is predicted once when a model loads and
+        # single-pair calls become table lookups.
+        self._trigger_table: List[Tuple[int, List[float]]] = []
+        self._trigger_size = 0
+        self._conflict_table: List[Tuple[int, List[float]]] = []
+        self._conflict_size = 0
+
     # ── validity (Layer 1) ───────────────────────────────────────────────
 
     def load_validity_model(
@@ -76,7 +91,14 @@ class GNNInference:
             state = torch.load(ckpt, map_location=self.device, weights_only=True)
             model.load_state_dict(state)
         model.to(self.device).eval()
-        self._validity_model = model
+        # Graph sizes vary per sentence, so compile with dynamic shapes.
+        self._validity_model = self._maybe_compile(
+            model,
+            torch.zeros(2, input_dim, device=self.device),
+            torch.tensor([[0, 1], [1, 0]], device=self.device),
+            torch.zeros(2, dtype=torch.long, device=self.device),
+            dynamic=True,
+        )
 
     # ── trigger (Layer 2) ────────────────────────────────────────────────
 
@@ -96,21 +118,37 @@ class GNNInference:
             state = torch.load(ckpt, map_location=self.device, weights_only=True)
             model.load_state_dict(state)
         model.to(self.device).eval()
+        model = self._maybe_compile(model, *self._pair_indices(vocab_size))
         self._trigger_model = model
+        self._trigger_table = self._pair_table(model, vocab_size)
+        self._trigger_size = vocab_size
 
     def predict_trigger(self, c1_idx: int, c2_idx: int) -> Dict[str, Any]:
         """Predict which sandhi rule fires for phoneme pair ``(c1, c2)``."""
         if self._trigger_model is None:
             self.load_trigger_model()
-        t1 = torch.tensor([c1_idx], device=self.device)
-        t2 = torch.tensor([c2_idx], device=self.device)
-        with torch.no_grad():
-            logits = self._trigger_model(t1, t2)
-            probs = torch.softmax(logits, dim=1)
-        pred = int(torch.argmax(probs, dim=1).item())
+        pred, probs = self._trigger_table[
+            _pair_slot(c1_idx, c2_idx, self._trigger_size)
+        ]
         return {
             "predicted_rule": pred,
-            "probabilities": probs[0].tolist(),
+            "probabilities": list(probs),
+        }
+
+    def predict_trigger_batch(
+        self, c1_idx: Sequence[int], c2_idx: Sequence[int]
+    ) -> Dict[str, Any]:
+        """Predict the sandhi rule for many phoneme pairs in one forward pass.
+
+        ``c1_idx`` and ``c2_idx`` are equal-length index sequences (lists,
+        arrays or tensors).  Returns per-pair lists in input order.
+        """
+        if self._trigger_model is None:
+            self.load_trigger_model()
+        probs = self._forward(self._trigger_model, c1_idx, c2_idx)
+        return {
+            "predicted_rule": probs.argmax(dim=1).tolist(),
+            "probabilities": probs.tolist(),
         }
 
     # ── conflict (Layer 3) ───────────────────────────────────────────────
@@ -130,20 +168,116 @@ class GNNInference:
             state = torch.load(ckpt, map_location=self.device, weights_only=True)
             model.load_state_dict(state)
         model.to(self.device).eval()
+        model = self._maybe_compile(model, *self._pair_indices(num_rules))
         self._conflict_model = model
+        self._conflict_table = self._pair_table(model, num_rules)
+        self._conflict_size = num_rules
 
     def predict_conflict(self, r1_idx: int, r2_idx: int) -> Dict[str, Any]:
         """Predict which rule wins in a conflict between rule r1 and rule r2."""
         if self._conflict_model is None:
             self.load_conflict_model()
-        t1 = torch.tensor([r1_idx], device=self.device)
-        t2 = torch.tensor([r2_idx], device=self.device)
-        with torch.no_grad():
-            logits = self._conflict_model(t1, t2)
-            probs = torch.softmax(logits, dim=1)
-        winner = int(torch.argmax(probs, dim=1).item())
+        winner, probs = self._conflict_table[
+            _pair_slot(r1_idx, r2_idx, self._conflict_size)
+        ]
         return {
             "winner": f"rule_{r1_idx}" if winner == 0 else f"rule_{r2_idx}",
             "winner_index": winner,
-            "probabilities": probs[0].tolist(),
+            "probabilities": list(probs),
+        }
+
+    def predict_conflict_batch(
+        self, r1_idx: Sequence[int], r2_idx: Sequence[int]
+    ) -> Dict[str, Any]:
+        """Resolve many rule conflicts in one forward pass.
+
+        ``r1_idx`` and ``r2_idx`` are equal-length index sequences.  Returns
+        per-pair lists in input order.
+        """
+        if self._conflict_model is None:
+            self.load_conflict_model()
+        probs = self._forward(self._conflict_model, r1_idx, r2_idx)
+        winners = probs.argmax(dim=1).tolist()
+        return {
+            "winner": [
+                f"rule_{int(r1)}" if w == 0 else f"rule_{int(r2)}"
+                for w, r1, r2 in zip(winners, r1_idx, r2_idx)
+            ],
+            "winner_index": winners,
+            "probabilities": probs.tolist(),
         }
+
+    # ── internals ────────────────────────────────────────────────────────
+
+    def _maybe_compile(
+        self,
+        model: "torch.nn.Module",
+        *example: "torch.Tensor",
+        dynamic: Optional[bool] = None,
+    ) -> Any:
+        """``torch.compile`` *model* and warm it up on *example* inputs.
+
+        Compiling is lazy, so the warm-up forward is what surfaces a missing
+        toolchain or an unsupported op; in that case the eager model is kept.
+        CUDA graphs (``reduce-overhead``) are only requested on CUDA.
+        """
+        if not self.compile_models or not hasattr(torch, "compile"):
+            return model
+        mode = "reduce-overhead" if self.device.type == "cuda" else "default"
+        try:
+            compiled = torch.compile(model, mode=mode, dynamic=dynamic)
+            with torch.inference_mode():
+                compiled(*example)
+        except Exception:
+            return model
+        return _EagerFallback(compiled, model)
+
+    def _pair_indices(self, size: int) -> Tuple["torch.Tensor", "torch.Tensor"]:
+        """Every ``(a, b)`` index pair below *size*, row-major."""
+        ids = torch.arange(size, device=self.device)
+        return ids.repeat_interleave(size), ids.repeat(size)
+
+    def _pair_table(
+        self, model: "torch.nn.Module", size: int
+    ) -> List[Tuple[int, List[float]]]:
+        """``(argmax, probabilities)`` for every index pair, row-major."""
+        probs = self._forward(model, *self._pair_indices(size))
+        return list(zip(probs.argmax(dim=1).tolist(), probs.tolist()))
+
+    def _forward(
+        self, model: "torch.nn.Module", a_idx: Sequence[int], b_idx: Sequence[int]
+    ) -> "torch.Tensor":
+        """Softmax probabilities of *model* over a batch of index pairs."""
+        t1 = torch.as_tensor(a_idx, dtype=torch.long, device=self.device)
+        t2 = torch.as_tensor(b_idx, dtype=torch.long, device=self.device)
+        with torch.inference_mode():
+            logits = model(t1, t2)
+            probs = torch.softmax(logits, dim=1)
+        return probs.cpu()
+
+
+class _EagerFallback:
+    """Call a compiled model; on any error, switch to the eager model for good.
+
+    ``torch.compile`` may recompile for input shapes not seen at warm-up,
+    and that can fail long after loading.  The failing call is retried
+    eagerly, so errors that are not the compiler's still propagate.
+    """
+
+    def __init__(self, compiled: Any, eager: "torch.nn.Module") -> None:
+        self._compiled = compiled
+        self._eager = eager
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._compiled is not None:
+            try:
+                return self._compiled(*args, **kwargs)
+            except Exception:
+                self._compiled = None
+        return self._eager(*args, **kwargs)
+
+
+def _pair_slot(a_idx: int, b_idx: int, size: int) -> int:
+    if not (0 <= a_idx < size and 0 <= b_idx < size):
+        raise IndexError(f"index pair ({a_idx}, {b_idx}) out of range for {size}")
+    return a_idx * size + b_idx
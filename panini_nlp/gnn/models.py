@@ -105,18 +105,16 @@ class TriggerNetwork(nn.Module):
         self.fc1 = nn.Linear(16 * 2, hidden_dim)
         self.fc2 = nn.Linear(hidden_dim, hidden_dim)
         self.fc3 = nn.Linear(hidden_dim, num_classes)
-        self.relu = nn.ReLU()
-        self.dropout = nn.Dropout(0.2)
 
     def forward(
         self, c1_idx: torch.Tensor, c2_idx: torch.Tensor
     ) -> torch.Tensor:
-        e1 = self.embedding(c1_idx)
-        e2 = self.embedding(c2_idx)
-        x = torch.cat([e1, e2], dim=1)
-        x = self.relu(self.fc1(x))
-        x = self.dropout(x)
-        x = self.relu(self.fc2(x))
+        # One lookup over both indices; flattening the pair axis gives the
+        # same [e1, e2] layout as concatenating two lookups.
+        x = self.embedding(torch.stack([c1_idx, c2_idx], dim=1)).flatten(1)
+        x = F.relu(self.fc1(x))
+        x = F.dropout(x, p=0.2, training=self.training)
+        x = F.relu(self.fc2(x))
         x = self.fc3(x)
         return x
 
@@ -148,17 +146,13 @@ class ConflictNetwork(nn.Module):
         self.fc1 = nn.Linear(32 * 2, hidden_dim)
         self.fc2 = nn.Linear(hidden_dim, hidden_dim)
         self.fc3 = nn.Linear(hidden_dim, 2)  # [Win_R1, Win_R2]
-        self.relu = nn.ReLU()
-        self.dropout = nn.Dropout(0.2)
 
     def forward(
         self, r1_idx: torch.Tensor, r2_idx: torch.Tensor
     ) -> torch.Tensor:
-        e1 = self.rule_emb(r1_idx)
-        e2 = self.rule_emb(r2_idx)
-        x = torch.cat([e1, e2], dim=1)
-        x = self.relu(self.fc1(x))
-        x = self.dropout(x)
-        x = self.relu(self.fc2(x))
+        x = self.rule_emb(torch.stack([r1_idx, r2_idx], dim=1)).flatten(1)
+        x = F.relu(self.fc1(x))
+        x = F.dropout(x, p=0.2, training=self.training)
+        x = F.relu(self.fc2(x))
         x = self.fc3(x)
         return x
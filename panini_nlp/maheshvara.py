@@ -1,10 +1,20 @@
 import math
+import sys
 from pathlib import Path
 
+# Sūtra counts are tiny, so primality is a table lookup (sieve built once).
+_SIEVE_LIMIT = 128
+_PRIMES = bytearray([1]) * _SIEVE_LIMIT
+_PRIMES[0] = _PRIMES[1] = 0
+for _i in range(2, math.isqrt(_SIEVE_LIMIT - 1) + 1):
+    if _PRIMES[_i]:
+        _PRIMES[_i * _i::_i] = bytes(len(range(_i * _i, _SIEVE_LIMIT, _i)))
+del _i
+
 def is_prime(n):
-    if n <= 1:
-        return False
-    for i in range(2, int(math.sqrt(n)) + 1):
+    if n < _SIEVE_LIMIT:
+        return n >= 0 and bool(_PRIMES[n])
+    for i in range(2, math.isqrt(n) + 1):
         if n % i == 0:
             return False
     return True
@@ -35,8 +45,9 @@ class MaheshvaraAnalyzer:
             self.sutras.append(clean)
 
     def analyze(self):
-        print(f"{'Sutra':<30} | {'Count':<5} | {'Type':<10}")
-        print("-" * 50)
+        # Collect every line and write once instead of one print per row.
+        lines = [f"{'Sutra':<30} | {'Count':<5} | {'Type':<10}", "-" * 50]
+        row = "{:<30} | {:<5} | {:<10}".format
         
         primes = 0
         total = 0
@@ -53,18 +64,20 @@ class MaheshvaraAnalyzer:
             count = len(parts) - 1
             if count < 1: count = 0 # Safety
             
-            p_status = "Prime" if is_prime(count) else "Non-Prime"
-            if is_prime(count):
+            prime = is_prime(count)
+            p_status = "Prime" if prime else "Non-Prime"
+            if prime:
                 primes += 1
             
-            print(f"{s:<30} | {count:<5} | {p_status:<10}")
+            lines.append(row(s, count, p_status))
             total += 1
             
-        print("-" * 50)
         percentage = (primes / total) * 100 if total > 0 else 0
-        print(f"Total Sutras: {total}")
-        print(f"Prime Counts: {primes}")
-        print(f"Primal Density: {percentage:.1f}%")
+        lines.append("-" * 50)
+        lines.append(f"Total Sutras: {total}")
+        lines.append(f"Prime Counts: {primes}")
+        lines.append(f"Primal Density: {percentage:.1f}%")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     analyzer = MaheshvaraAnalyzer()
@@ -9,9 +9,10 @@ It supports:
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from panini_nlp.morphology import MorphologicalAnalyzer
+from panini_nlp._compat import DATACLASS_SLOTS
+from panini_nlp.morphology import MorphAnalysis, MorphologicalAnalyzer
 from panini_nlp.validator import SanskritValidator
 
 __all__ = [
@@ -20,8 +21,11 @@ __all__ = [
     "SanskritMeaningEngine",
 ]
 
+# The words of one segment, in order, each with its morphological analyses.
+_WordAnalyses = List[Tuple[str, List[MorphAnalysis]]]
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MeaningSegment:
     index: int
     source: str
@@ -31,14 +35,18 @@ class MeaningSegment:
     grammar: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "index": self.index,
-            "source": self.source,
-            "meaning": self.meaning,
-            "meaning_mode": self.meaning_mode,
-            "confidence": self.confidence,
-            "grammar": self.grammar,
-        }
+        return _segment_dict(self)
+
+
+def _segment_dict(segment: MeaningSegment) -> Dict[str, Any]:
+    return {
+        "index": segment.index,
+        "source": segment.source,
+        "meaning": segment.meaning,
+        "meaning_mode": segment.meaning_mode,
+        "confidence": segment.confidence,
+        "grammar": segment.grammar,
+    }
 
 
 @dataclass
@@ -53,7 +61,9 @@ class MeaningReport:
             "split_mode": self.split_mode,
             "segment_count": self.segment_count,
             "summary": self.summary,
-            "segments": [s.to_dict() for s in self.segments],
+            # One plain function mapped over the list; no per-segment
+            # bound-method dispatch.
+            "segments": list(map(_segment_dict, self.segments)),
         }
 
 
@@ -67,16 +77,24 @@ class SanskritMeaningEngine:
     translator:
         Optional callable ``translator(text: str) -> str`` used for fluent output.
         If omitted, the engine falls back to deterministic heuristic meaning.
+    translator_batch:
+        Optional callable ``translator_batch(texts: List[str]) -> List[str]``
+        returning one translation per text.  When set, fluent mode sends every
+        segment of a document in a single call, which lets model-backed
+        translators fill their batches; ``translator`` is then only used if
+        the batch call raises or returns the wrong number of translations.
     """
 
     def __init__(
         self,
         validator: Optional[SanskritValidator] = None,
         translator: Optional[Callable[[str], str]] = None,
+        translator_batch: Optional[Callable[[List[str]], List[str]]] = None,
     ) -> None:
         self.validator = validator or SanskritValidator()
         self.morphology = MorphologicalAnalyzer()
         self.translator = translator
+        self.translator_batch = translator_batch
 
     def analyze_document_meaning(
         self,
@@ -84,18 +102,49 @@ class SanskritMeaningEngine:
         split_mode: str = "verse",
         meaning_mode: str = "fluent",
         require_fluent_model: bool = False,
+        n_jobs: Optional[int] = None,
     ) -> MeaningReport:
-        """Analyze a full text and return line-by-line meaning."""
-        doc = self.validator.validate_document(text, split_mode=split_mode)
+        """Analyze a full text and return line-by-line meaning.
+
+        ``n_jobs`` is passed to ``SanskritValidator.validate_document``, which
+        validates the segments in that many worker processes (``-1`` uses
+        every CPU).  Meaning is rendered in this process, since the
+        translator callback need not be picklable.
+        """
+        doc = self.validator.validate_document(
+            text, split_mode=split_mode, n_jobs=n_jobs
+        )
+
+        texts = [item["text"] for item in doc["segments"]]
+        fluent = meaning_mode.strip().lower() == "fluent"
+        has_translator = self.translator is not None or self.translator_batch is not None
+
+        # Morphology runs as its own phase: words recur across segments, so
+        # each distinct word is analyzed once for the whole document and the
+        # heuristics only read the results.  Skipped when a translator will
+        # do the work.
+        analyses_by_segment: List[Optional[_WordAnalyses]] = [None] * len(texts)
+        if not (fluent and has_translator):
+            analyses_by_segment = self._analyze_segments(texts)
 
+        translations: List[Optional[str]] = [None] * len(texts)
+        if fluent and self.translator_batch is not None and texts:
+            translations = self._translate_batch(texts)
+
+        # Summary statistics are accumulated while the segments are built.
         segments: List[MeaningSegment] = []
-        for item in doc["segments"]:
-            source = item["text"]
+        conf_sum = 0.0
+        mode_counts: Dict[str, int] = {}
+        for item, source, analyses, translation in zip(
+            doc["segments"], texts, analyses_by_segment, translations
+        ):
             grammar = item["result"]
             meaning, confidence, resolved_mode = self._render_meaning(
                 source,
                 meaning_mode=meaning_mode,
                 require_fluent_model=require_fluent_model,
+                analyses=analyses,
+                translation=translation,
             )
 
             segments.append(
@@ -108,15 +157,10 @@ class SanskritMeaningEngine:
                     grammar=grammar,
                 )
             )
+            conf_sum += confidence
+            mode_counts[resolved_mode] = mode_counts.get(resolved_mode, 0) + 1
 
-        if segments:
-            avg_conf = sum(s.confidence for s in segments) / len(segments)
-        else:
-            avg_conf = 0.0
-
-        mode_counts: Dict[str, int] = {}
-        for seg in segments:
-            mode_counts[seg.meaning_mode] = mode_counts.get(seg.meaning_mode, 0) + 1
+        avg_conf = conf_sum / len(segments) if segments else 0.0
 
         summary = {
             "valid_segments": doc["summary"]["valid_segments"],
@@ -134,51 +178,80 @@ class SanskritMeaningEngine:
             segments=segments,
         )
 
+    def _analyze_segments(self, texts: List[str]) -> List[_WordAnalyses]:
+        """Pair every word of every text with its morphological analyses."""
+        split = [text.split() for text in texts]
+        by_word = {w: self.morphology.analyze(w) for words in split for w in words}
+        return [[(w, by_word[w]) for w in words] for words in split]
+
+    def _translate_batch(self, texts: List[str]) -> List[Optional[str]]:
+        """Translate *texts* in one batch call; all ``None`` on failure."""
+        try:
+            translations = list(self.translator_batch(texts))  # type: ignore[misc]
+        except Exception:
+            return [None] * len(texts)
+        if len(translations) != len(texts):
+            # Misaligned output cannot be matched to segments; treat it as
+            # a failed call.
+            return [None] * len(texts)
+        return translations
+
     def _render_meaning(
         self,
         text: str,
         meaning_mode: str = "fluent",
         require_fluent_model: bool = False,
+        analyses: Optional[_WordAnalyses] = None,
+        translation: Optional[str] = None,
     ) -> tuple[str, float, str]:
         mode = meaning_mode.strip().lower()
 
         if mode == "fluent":
-            if self.translator is not None:
+            if translation is None and self.translator is not None:
                 try:
-                    translated = self.translator(text)
-                    if translated and translated.strip():
-                        return translated.strip(), 0.85, "fluent_model"
+                    translation = self.translator(text)
                 except Exception:
                     pass
+            if translation and translation.strip():
+                return translation.strip(), 0.85, "fluent_model"
             if require_fluent_model:
                 raise RuntimeError(
                     "Fluent model translation requested, but no translator callback is configured."
                 )
             # fallback when no translator/model is available
-            return self._heuristic_fluent(text), 0.45, "heuristic_fallback"
+            if analyses is None:
+                analyses = self._analyze_segments([text])[0]
+            return (
+                self._heuristic_fluent(text, analyses),
+                0.45,
+                "heuristic_fallback",
+            )
 
         if mode == "literal":
-            return self._heuristic_literal(text), 0.55, "literal_heuristic"
+            if analyses is None:
+                analyses = self._analyze_segments([text])[0]
+            return (
+                self._heuristic_literal(analyses),
+                0.55,
+                "literal_heuristic",
+            )
 
         raise ValueError("meaning_mode must be one of: fluent, literal")
 
-    def _heuristic_fluent(self, text: str) -> str:
-        words = [w for w in text.split() if w.strip()]
+    def _heuristic_fluent(self, text: str, analyses: _WordAnalyses) -> str:
         subjects: List[str] = []
         objects: List[str] = []
         verbs: List[str] = []
 
-        for word in words:
-            analyses = self.morphology.analyze(word)
-            for analysis in analyses:
-                if analysis.vibhakti == "Nominative":
-                    subjects.append(analysis.stem or word)
-                    break
-                if analysis.vibhakti == "Accusative":
-                    objects.append(analysis.stem or word)
-                    break
-                if analysis.category == "Tiṅanta":
-                    verbs.append(analysis.stem or word)
+        by_case = {"Nominative": subjects, "Accusative": objects}
+
+        for word, word_analyses in analyses:
+            for analysis in word_analyses:
+                target = by_case.get(analysis.vibhakti)
+                if target is None and analysis.category == "Tiṅanta":
+                    target = verbs
+                if target is not None:
+                    target.append(analysis.stem or word)
                     break
 
         if subjects or objects or verbs:
@@ -191,13 +264,11 @@ class SanskritMeaningEngine:
 
         return f"Approximate meaning (heuristic): {text}"
 
-    def _heuristic_literal(self, text: str) -> str:
-        words = [w for w in text.split() if w.strip()]
+    def _heuristic_literal(self, analyses: _WordAnalyses) -> str:
         parts: List[str] = []
 
-        for word in words:
-            analyses = self.morphology.analyze(word)
-            first = analyses[0] if analyses else None
+        for word, word_analyses in analyses:
+            first = word_analyses[0] if word_analyses else None
             if first and first.vibhakti:
                 parts.append(f"{word}[{first.vibhakti}/{first.vacana}]")
             elif first and first.category == "Tiṅanta":
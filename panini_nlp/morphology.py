@@ -15,13 +15,16 @@ Currently covers:
   - Present tense Parasmaipada & Ātmanepada verb endings
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from panini_nlp._compat import DATACLASS_SLOTS
 
 __all__ = ["MorphAnalysis", "MorphologicalAnalyzer"]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MorphAnalysis:
     """Result of Pāṇinian morphological analysis."""
     original: str
@@ -56,6 +59,125 @@ _KARAKA_MAP = {
 }
 
 
+# Noun and verb endings share one trie, keyed by their characters in
+# reverse.  A node that completes an ending holds ``(ending, attrs)`` under
+# its table's tag; tags are longer than one character, so they never clash
+# with the character edges.
+_SUP = "sup"
+_TIN = "tiṅ"
+
+_Trie = Dict[str, Any]
+
+
+def _suffix_trie(tables: Dict[str, Dict[str, Dict[str, str]]]) -> _Trie:
+    """Trie of the endings of every table in *tables*, spelled backwards."""
+    root: _Trie = {}
+    for tag, endings in tables.items():
+        for ending, attrs in endings.items():
+            node = root
+            for ch in reversed(ending):
+                node = node.setdefault(ch, {})
+            node[tag] = (ending, attrs)
+    return root
+
+
+def _matching_endings(
+    trie: _Trie, word: str
+) -> Tuple[List[Tuple[str, Dict[str, str]]], List[Tuple[str, Dict[str, str]]]]:
+    """Noun and verb endings that *word* ends with, each longest first.
+
+    One right-to-left walk serves both tables and stops at the first
+    character no ending shares.
+    """
+    nouns = []
+    verbs = []
+    node = trie
+    for ch in reversed(word):
+        node = node.get(ch)
+        if node is None:
+            break
+        if _SUP in node:
+            nouns.append(node[_SUP])
+        if _TIN in node:
+            verbs.append(node[_TIN])
+    nouns.reverse()
+    verbs.reverse()
+    return nouns, verbs
+
+
+# ── Ending tables ────────────────────────────────────────────────────────────
+
+# sup-pratyaya for a-stem masculine (rāma-śabda) — Devanāgarī + IAST
+_NOUN_ENDINGS: Dict[str, Dict[str, str]] = {
+    # Devanāgarī
+    "ः":   {"case": "Nominative",   "number": "Singular"},
+    "ौ":   {"case": "Nominative",   "number": "Dual"},
+    "ाः":  {"case": "Nominative",   "number": "Plural"},
+    "म्":  {"case": "Accusative",   "number": "Singular"},
+    "ान्": {"case": "Accusative",   "number": "Plural"},
+    "ेन":  {"case": "Instrumental", "number": "Singular"},
+    "ेण":  {"case": "Instrumental", "number": "Singular"},
+    "ाभ्याम्": {"case": "Instrumental", "number": "Dual"},
+    "ैः":  {"case": "Instrumental", "number": "Plural"},
+    "ाय":  {"case": "Dative",       "number": "Singular"},
+    "ेभ्यः": {"case": "Dative",     "number": "Plural"},
+    "ात्": {"case": "Ablative",     "number": "Singular"},
+    "स्य": {"case": "Genitive",     "number": "Singular"},
+    "योः": {"case": "Genitive",     "number": "Dual"},
+    "ानाम्": {"case": "Genitive",   "number": "Plural"},
+    "े":   {"case": "Locative",     "number": "Singular"},
+    "ेषु": {"case": "Locative",     "number": "Plural"},
+    # IAST
+    "aḥ":   {"case": "Nominative",   "number": "Singular"},
+    "au":   {"case": "Nominative",   "number": "Dual"},
+    "āḥ":   {"case": "Nominative",   "number": "Plural"},
+    "am":   {"case": "Accusative",   "number": "Singular"},
+    "ān":   {"case": "Accusative",   "number": "Plural"},
+    "ena":  {"case": "Instrumental", "number": "Singular"},
+    "eṇa":  {"case": "Instrumental", "number": "Singular"},
+    "ābhyām": {"case": "Instrumental", "number": "Dual"},
+    "aiḥ":  {"case": "Instrumental", "number": "Plural"},
+    "āya":  {"case": "Dative",       "number": "Singular"},
+    "ebhyaḥ": {"case": "Dative",     "number": "Plural"},
+    "āt":   {"case": "Ablative",     "number": "Singular"},
+    "asya": {"case": "Genitive",     "number": "Singular"},
+    "ayoḥ": {"case": "Genitive",     "number": "Dual"},
+    "ānām": {"case": "Genitive",     "number": "Plural"},
+    "e":    {"case": "Locative",     "number": "Singular"},
+    "eṣu":  {"case": "Locative",     "number": "Plural"},
+}
+
+# tiṅ-pratyaya — Parasmaipada/Ātmanepada Laṭ (present)
+_VERB_ENDINGS: Dict[str, Dict[str, str]] = {
+    # Devanāgarī
+    "ति":   {"person": "Prathama", "number": "Singular"},
+    "तः":   {"person": "Prathama", "number": "Dual"},
+    "न्ति": {"person": "Prathama", "number": "Plural"},
+    "सि":   {"person": "Madhyama", "number": "Singular"},
+    "थः":   {"person": "Madhyama", "number": "Dual"},
+    "थ":    {"person": "Madhyama", "number": "Plural"},
+    "मि":   {"person": "Uttama",   "number": "Singular"},
+    "वः":   {"person": "Uttama",   "number": "Dual"},
+    "मः":   {"person": "Uttama",   "number": "Plural"},
+    "ते":   {"person": "Prathama", "number": "Singular"},  # Ātmanepada
+    # IAST
+    "ti":   {"person": "Prathama", "number": "Singular"},
+    "taḥ":  {"person": "Prathama", "number": "Dual"},
+    "nti":  {"person": "Prathama", "number": "Plural"},
+    "si":   {"person": "Madhyama", "number": "Singular"},
+    "thaḥ": {"person": "Madhyama", "number": "Dual"},
+    "tha":  {"person": "Madhyama", "number": "Plural"},
+    "mi":   {"person": "Uttama",   "number": "Singular"},
+    "vaḥ":  {"person": "Uttama",   "number": "Dual"},
+    "maḥ":  {"person": "Uttama",   "number": "Plural"},
+    "te":   {"person": "Prathama", "number": "Singular"},
+}
+
+# Reversed-suffix trie: a word is matched against every ending by walking it
+# right to left once, stopping at the first mismatch.
+_ENDING_TRIE = _suffix_trie({_SUP: _NOUN_ENDINGS, _TIN: _VERB_ENDINGS})
+
+
 class MorphologicalAnalyzer:
     """
     Rule-based morphological analyzer for Sanskrit.
@@ -66,111 +188,79 @@ class MorphologicalAnalyzer:
     'Genitive'
     """
 
-    def __init__(self) -> None:
-        # sup-pratyaya for a-stem masculine (rāma-śabda) — Devanāgarī + IAST
-        self._noun_endings: Dict[str, Dict[str, str]] = {
-            # Devanāgarī
-            "ः":   {"case": "Nominative",   "number": "Singular"},
-            "ौ":   {"case": "Nominative",   "number": "Dual"},
-            "ाः":  {"case": "Nominative",   "number": "Plural"},
-            "म्":  {"case": "Accusative",   "number": "Singular"},
-            "ान्": {"case": "Accusative",   "number": "Plural"},
-            "ेन":  {"case": "Instrumental", "number": "Singular"},
-            "ेण":  {"case": "Instrumental", "number": "Singular"},
-            "ाभ्याम्": {"case": "Instrumental", "number": "Dual"},
-            "ैः":  {"case": "Instrumental", "number": "Plural"},
-            "ाय":  {"case": "Dative",       "number": "Singular"},
-            "ेभ्यः": {"case": "Dative",     "number": "Plural"},
-            "ात्": {"case": "Ablative",     "number": "Singular"},
-            "स्य": {"case": "Genitive",     "number": "Singular"},
-            "योः": {"case": "Genitive",     "number": "Dual"},
-            "ानाम्": {"case": "Genitive",   "number": "Plural"},
-            "े":   {"case": "Locative",     "number": "Singular"},
-            "ेषु": {"case": "Locative",     "number": "Plural"},
-            # IAST
-            "aḥ":   {"case": "Nominative",   "number": "Singular"},
-            "au":   {"case": "Nominative",   "number": "Dual"},
-            "āḥ":   {"case": "Nominative",   "number": "Plural"},
-            "am":   {"case": "Accusative",   "number": "Singular"},
-            "ān":   {"case": "Accusative",   "number": "Plural"},
-            "ena":  {"case": "Instrumental", "number": "Singular"},
-            "eṇa":  {"case": "Instrumental", "number": "Singular"},
-            "ābhyām": {"case": "Instrumental", "number": "Dual"},
-            "aiḥ":  {"case": "Instrumental", "number": "Plural"},
-            "āya":  {"case": "Dative",       "number": "Singular"},
-            "ebhyaḥ": {"case": "Dative",     "number": "Plural"},
-            "āt":   {"case": "Ablative",     "number": "Singular"},
-            "asya": {"case": "Genitive",     "number": "Singular"},
-            "ayoḥ": {"case": "Genitive",     "number": "Dual"},
-            "ānām": {"case": "Genitive",     "number": "Plural"},
-            "e":    {"case": "Locative",     "number": "Singular"},
-            "eṣu":  {"case": "Locative",     "number": "Plural"},
-        }
-
-        # tiṅ-pratyaya — Parasmaipada/Ātmanepada Laṭ (present)
-        self._verb_endings: Dict[str, Dict[str, str]] = {
-            # Devanāgarī
-            "ति":   {"person": "Prathama", "number": "Singular"},
-            "तः":   {"person": "Prathama", "number": "Dual"},
-            "न्ति": {"person": "Prathama", "number": "Plural"},
-            "सि":   {"person": "Madhyama", "number": "Singular"},
-            "थः":   {"person": "Madhyama", "number": "Dual"},
-            "थ":    {"person": "Madhyama", "number": "Plural"},
-            "मि":   {"person": "Uttama",   "number": "Singular"},
-            "वः":   {"person": "Uttama",   "number": "Dual"},
-            "मः":   {"person": "Uttama",   "number": "Plural"},
-            "ते":   {"person": "Prathama", "number": "Singular"},  # Ātmanepada
-            # IAST
-            "ti":   {"person": "Prathama", "number": "Singular"},
-            "taḥ":  {"person": "Prathama", "number": "Dual"},
-            "nti":  {"person": "Prathama", "number": "Plural"},
-            "si":   {"person": "Madhyama", "number": "Singular"},
-            "thaḥ": {"person": "Madhyama", "number": "Dual"},
-            "tha":  {"person": "Madhyama", "number": "Plural"},
-            "mi":   {"person": "Uttama",   "number": "Singular"},
-            "vaḥ":  {"person": "Uttama",   "number": "Dual"},
-            "maḥ":  {"person": "Uttama",   "number": "Plural"},
-            "te":   {"person": "Prathama", "number": "Singular"},
-        }
+    def __init__(self, cache_size: Optional[int] = 100_000) -> None:
+        # Word frequencies are Zipfian, so analyses are memoized per
+        # instance.  ``analyze`` hands out copies so callers may edit
+        # ``attributes`` without touching the memo.
+        self._cache_size = cache_size
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze)
+
+        # Ending tables and their trie are shared module-level constants.
+        self._noun_endings = _NOUN_ENDINGS
+        self._verb_endings = _VERB_ENDINGS
+        self._ending_trie = _ENDING_TRIE
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The memo wraps a bound method and cannot be pickled; copies and
+        # unpickled instances start with an empty one.
+        state = self.__dict__.copy()
+        del state["_analyze_cached"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._analyze_cached = lru_cache(maxsize=self._cache_size)(self._analyze)
 
     # ── public API ───────────────────────────────────────────────────────────
 
     def analyze(self, word: str) -> List[MorphAnalysis]:
         """Return all possible morphological decompositions of *word*."""
-        word = word.strip()
+        return [
+            replace(a, attributes=dict(a.attributes))
+            for a in self._analyze_cached(word.strip())
+        ]
+
+    def analyze_many(self, words: Iterable[str]) -> List[List[MorphAnalysis]]:
+        """Run :meth:`analyze` for each word in *words*, in order."""
+        analyze = self.analyze
+        return [analyze(word) for word in words]
+
+    def clear_cache(self) -> None:
+        """Drop all memoized ``analyze`` results."""
+        self._analyze_cached.cache_clear()
+
+    def _analyze(self, word: str) -> Tuple[MorphAnalysis, ...]:
         analyses: List[MorphAnalysis] = []
 
+        noun_hits, verb_hits = _matching_endings(self._ending_trie, word)
+
         # Try longest-suffix-first for nouns
-        for ending in sorted(self._noun_endings, key=len, reverse=True):
-            if word.endswith(ending):
-                attrs = self._noun_endings[ending]
-                stem = word[: -len(ending)]
-                analyses.append(MorphAnalysis(
-                    original=word,
-                    stem=stem,
-                    suffix=ending,
-                    category="Subanta",
-                    vibhakti=attrs["case"],
-                    vacana=attrs["number"],
-                    linga="Masculine (a-stem)",
-                    attributes=attrs,
-                ))
+        for ending, attrs in noun_hits:
+            stem = word[: -len(ending)]
+            analyses.append(MorphAnalysis(
+                original=word,
+                stem=stem,
+                suffix=ending,
+                category="Subanta",
+                vibhakti=attrs["case"],
+                vacana=attrs["number"],
+                linga="Masculine (a-stem)",
+                attributes=dict(attrs),
+            ))
 
         # Verbs
-        for ending in sorted(self._verb_endings, key=len, reverse=True):
-            if word.endswith(ending):
-                attrs = self._verb_endings[ending]
-                stem = word[: -len(ending)]
-                analyses.append(MorphAnalysis(
-                    original=word,
-                    stem=stem,
-                    suffix=ending,
-                    category="Tiṅanta",
-                    lakara="Laṭ (Present)",
-                    purusha=attrs["person"],
-                    vacana=attrs["number"],
-                    attributes=attrs,
-                ))
+        for ending, attrs in verb_hits:
+            stem = word[: -len(ending)]
+            analyses.append(MorphAnalysis(
+                original=word,
+                stem=stem,
+                suffix=ending,
+                category="Tiṅanta",
+                lakara="Laṭ (Present)",
+                purusha=attrs["person"],
+                vacana=attrs["number"],
+                attributes=dict(attrs),
+            ))
 
         # Fallback
         if not analyses:
@@ -180,7 +270,7 @@ class MorphologicalAnalyzer:
                 attributes={"status": "unanalyzed"},
             ))
 
-        return analyses
+        return tuple(analyses)
 
     @staticmethod
     def get_karaka(analysis: MorphAnalysis) -> str:
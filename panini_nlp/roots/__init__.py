@@ -1,7 +1,11 @@
-from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from dataclasses import dataclass, field
+import importlib
+from typing import Callable, Dict, Iterable, List, Optional
 
-@dataclass
+from .._compat import DATACLASS_SLOTS
+from ._index import RootIndex
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Dhatu:
     id: str  # e.g. "1.1"
     ganapath_code: str # e.g. "bhvadi"
@@ -9,13 +13,28 @@ class Dhatu:
     meaning: str # e.g. "sattāyām"
     pada: str # "P" | "A" | "U"
     set_anit: str # "S" | "A" | "V"
+    impl: Optional[Callable] = field(default=None, repr=False, compare=False)
 
 class RootRegistry:
-    def __init__(self):
+    def __init__(self, loader: Optional[Callable[[], None]] = None):
         self._roots: Dict[str, Dhatu] = {}
-        self._implementations: Dict[str, Callable] = {}
+        self._index: Optional[RootIndex] = None
+        # Called once, before the first read or registration, to import the
+        # modules that populate the registry.
+        self._loader = loader
+        # Set when a registration may have broken gana order; cleared by
+        # _ordered_roots.
+        self._unsorted = False
+
+    def _ensure_loaded(self) -> None:
+        loader = self._loader
+        if loader is not None:
+            self._loader = None
+            loader()
 
     def register(self, id: str, root: str, meaning: str, gana: str):
+        self._ensure_loaded()
+
         def decorator(func: Callable):
             self._roots[id] = Dhatu(
                 id=id, 
@@ -23,25 +42,87 @@ class RootRegistry:
                 root=root, 
                 meaning=meaning,
                 pada="Unknown", # To be populated
-                set_anit="Unknown"
+                set_anit="Unknown",
+                impl=func,
             )
-            self._implementations[id] = func
+            self._index = None
+            self._unsorted = True
             return func
         return decorator
 
     def get(self, id: str) -> Optional[Dhatu]:
+        self._ensure_loaded()
         return self._roots.get(id)
 
+    def get_implementation(self, id: str) -> Optional[Callable]:
+        self._ensure_loaded()
+        dhatu = self._roots.get(id)
+        return dhatu.impl if dhatu is not None else None
+
+    def find_prefix(self, prefix: str) -> List[Dhatu]:
+        """All roots whose surface form starts with *prefix*."""
+        return self._get_index().find_prefix(prefix)
+
+    def find_containing(self, fragment: str) -> List[Dhatu]:
+        """All roots whose surface form contains *fragment*."""
+        return self._get_index().find_containing(fragment)
+
+    def lookup_any(self, fragments: Iterable[str]) -> Optional[Dhatu]:
+        """First registered root whose surface contains any of *fragments*."""
+        return self._get_index().first_containing_any(fragments)
+
+    def _ordered_roots(self) -> Iterable[Dhatu]:
+        """Roots in gana order, registration order within each gana.
+
+        Importing a gana module directly triggers the loader from inside
+        that module's first registration, so its remaining roots land after
+        every later gana; a stable sort by gana restores the order.
+        """
+        self._ensure_loaded()
+        if self._unsorted:
+            rank = len(_GANA_MODULES)
+            ordered = sorted(
+                self._roots.items(),
+                key=lambda item: _GANA_RANK.get(item[1].ganapath_code.lower(), rank),
+            )
+            self._roots = dict(ordered)
+            self._unsorted = False
+        return self._roots.values()
+
+    def _get_index(self) -> RootIndex:
+        if self._index is None:
+            self._index = RootIndex(self._ordered_roots())
+        return self._index
+
     def __iter__(self):
-        return iter(self._roots.values())
+        return iter(self._ordered_roots())
 
-# Global registry
-registry = RootRegistry()
-
-# Auto-import generated modules to populate registry
-from . import (
-    gana_1_bhvadi, gana_2_adadi, gana_3_juhotyadi,
-    gana_4_divadi, gana_5_svadi, gana_6_tudadi,
-    gana_7_rudhadi, gana_8_tanadi, gana_9_kryadi,
-    gana_10_curadi
+# Generated modules that populate the registry.  They are imported on first
+# use of ``registry`` (or first access as attributes of this package), not
+# when the package is imported.
+_GANA_MODULES = (
+    "gana_1_bhvadi", "gana_2_adadi", "gana_3_juhotyadi",
+    "gana_4_divadi", "gana_5_svadi", "gana_6_tudadi",
+    "gana_7_rudhadi", "gana_8_tanadi", "gana_9_kryadi",
+    "gana_10_curadi",
 )
+# "gana_3_juhotyadi" -> "juhotyadi" -> 2, matched against Dhatu.ganapath_code.
+_GANA_RANK = {name.split("_", 2)[2]: i for i, name in enumerate(_GANA_MODULES)}
+
+
+def _load_ganas() -> None:
+    for name in _GANA_MODULES:
+        importlib.import_module(f"{__name__}.{name}")
+
+
+def __getattr__(name: str):
+    if name in _GANA_MODULES:
+        # Load every gana, not just the one asked for; the registry restores
+        # gana order on read whichever module was touched first.
+        registry._ensure_loaded()
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Global registry
+registry = RootRegistry(loader=_load_ganas)
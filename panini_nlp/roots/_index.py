@@ -0,0 +1,73 @@
+"""Lookup indices over the registered Dhātus.
+
+Built lazily by ``RootRegistry`` the first time a search is made, so
+importing the registry stays as cheap as before.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+
+class _TrieNode:
+    __slots__ = ("children", "roots")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.roots: List = []  # every root whose surface passes through here
+
+
+class RootIndex:
+    """Prefix trie and substring index keyed on each Dhātu's ``root`` text.
+
+    Both lookups cost time proportional to the query, independent of the
+    registry size, and return roots in registration order.
+    """
+
+    def __init__(self, roots: Iterable) -> None:
+        self._all: List = []
+        self._position: Dict[int, int] = {}  # id(dhatu) → registration order
+        self._trie = _TrieNode()
+        self._substrings: Dict[str, List] = {}
+
+        for dhatu in roots:
+            self._position[id(dhatu)] = len(self._all)
+            self._all.append(dhatu)
+            surface = dhatu.root
+
+            node = self._trie
+            for ch in surface:
+                node = node.children.setdefault(ch, _TrieNode())
+                node.roots.append(dhatu)
+
+            seen = set()
+            for start in range(len(surface)):
+                for end in range(start + 1, len(surface) + 1):
+                    sub = surface[start:end]
+                    if sub not in seen:
+                        seen.add(sub)
+                        self._substrings.setdefault(sub, []).append(dhatu)
+
+    def find_prefix(self, prefix: str) -> List:
+        if not prefix:
+            return list(self._all)
+        node = self._trie
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return list(node.roots)
+
+    def find_containing(self, fragment: str) -> List:
+        if not fragment:
+            return list(self._all)
+        return list(self._substrings.get(fragment, ()))
+
+    def first_containing_any(self, fragments: Iterable[str]) -> Optional[object]:
+        best = None
+        best_pos = len(self._all)
+        for fragment in fragments:
+            matches = self._all if not fragment else self._substrings.get(fragment)
+            if matches:
+                pos = self._position[id(matches[0])]
+                if pos < best_pos:
+                    best, best_pos = matches[0], pos
+        return best
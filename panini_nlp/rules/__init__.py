@@ -1,22 +1,25 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, Dict, Optional
 
-@dataclass
+from .._compat import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Sutra:
     id: str
     text: str
     description: str = ""
     source: str = "Ashtadhyayi"
+    impl: Optional[Callable] = field(default=None, repr=False, compare=False)
 
 class RuleRegistry:
     def __init__(self):
         self._rules: Dict[str, Sutra] = {}
-        self._implementations: Dict[str, Callable] = {}
 
     def register(self, id: str, text: str = ""):
         def decorator(func: Callable):
-            self._rules[id] = Sutra(id=id, text=text, description=func.__doc__ or "")
-            self._implementations[id] = func
+            self._rules[id] = Sutra(
+                id=id, text=text, description=func.__doc__ or "", impl=func
+            )
             return func
         return decorator
 
@@ -24,7 +27,8 @@ class RuleRegistry:
         return self._rules.get(id)
 
     def get_implementation(self, id: str) -> Optional[Callable]:
-        return self._implementations.get(id)
+        sutra = self._rules.get(id)
+        return sutra.impl if sutra is not None else None
 
     def __iter__(self):
         return iter(self._rules.values())
@@ -10,15 +10,79 @@ Pāṇinian grammar:
   - Dvandva (Copulative)
   - Avyayībhāva (Adverbial)
   - Karmadhāraya (Descriptive / Appositional)
+
+Optional: pyahocorasick (``pip install pyahocorasick``) to find all known
+constituents in a single pass over the word.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from panini_nlp._compat import DATACLASS_SLOTS
 
 __all__ = ["SamasaAnalyzer", "SamasaResult"]
 
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+
+# Known compounds, tried in order: (type, first members, second members,
+# meaning).  The first rule with a first and a second member both present
+# in the stem wins.
+_CompoundRule = Tuple[str, Tuple[str, ...], Tuple[str, ...], str]
+
+_COMPOUND_RULES: Tuple[_CompoundRule, ...] = (
+    # Bahuvrīhi
+    ("Bahuvrīhi (Possessive)",
+     ("pīta", "pita", "पीत"), ("ambara", "अम्बर", "āmbara"),
+     "One who has yellow garments (Viṣṇu)"),
+    ("Bahuvrīhi (Possessive)",
+     ("gaja", "गज"), ("ānana", "anana", "आनन"),
+     "One who has an elephant face (Gaṇeśa)"),
+    ("Bahuvrīhi (Possessive)",
+     ("nara", "नर"), ("siṃha", "simha", "सिंह"),
+     "One who is a lion among men (Viṣṇu)"),
+    # Karmadhāraya
+    ("Karmadhāraya (Descriptive)",
+     ("nīla", "neela", "नील"), ("kamala", "कमल"), "The blue lotus"),
+    ("Karmadhāraya (Descriptive)",
+     ("mahā", "maha", "महा"), ("deva", "देव"), "The great god"),
+    ("Karmadhāraya (Descriptive)",
+     ("mahā", "maha", "महा"), ("rāja", "raja", "राज"), "The great king"),
+    # Tatpuruṣa
+    ("Tatpuruṣa (Determinative)",
+     ("rāja", "raja", "राज"), ("puruṣa", "purusha", "पुरुष"),
+     "Man of the King"),
+    ("Tatpuruṣa (Determinative)",
+     ("deva", "देव"), ("dāsa", "dasa", "दास"),
+     "Servant of god"),
+    ("Tatpuruṣa (Determinative)",
+     ("dharma", "धर्म"), ("artha", "अर्थ"),
+     "Meaning of dharma"),
+)
+
+_CONSTITUENTS: Tuple[str, ...] = tuple(sorted({
+    part for _, firsts, seconds, _ in _COMPOUND_RULES for part in firsts + seconds
+}))
+
 
-@dataclass
+@lru_cache(maxsize=1)
+def _constituent_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Aho-Corasick automaton over every compound member, built once."""
+    if not _HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for part in _CONSTITUENTS:
+        automaton.add_word(part, part)
+    automaton.make_automaton()
+    return automaton
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SamasaResult:
     """Result of compound analysis."""
 
@@ -38,12 +102,20 @@ class SamasaAnalyzer:
     'Bahuvrīhi (Possessive)'
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_size: Optional[int] = 50_000) -> None:
+        # Compounds recur across a corpus, so results are memoized per
+        # instance.  ``SamasaResult`` objects are shared between callers and
+        # must be treated as read-only; call ``clear_cache`` after editing
+        # ``avyaya_prefixes`` or ``lexicon``.
+        self._cache_size = cache_size
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze)
+
         # ── Avyayībhāva prefixes ─────────────────────────────────────────
         self.avyaya_prefixes = [
             "yathā", "yatha", "prati", "upa", "anu", "nir", "sah",
             "यथा", "प्रति", "उप", "अनु", "निर्", "सह",
         ]
+        self._avyaya_prefixes = self._longest_first(self.avyaya_prefixes)
 
         # ── Known lexical items  (IAST + Devanāgarī) ─────────────────────
         self.lexicon: Dict[str, str] = {
@@ -89,49 +161,81 @@ class SamasaAnalyzer:
             "महा": "great",
         }
 
+        self._lex_keys = self._lexicon_keys(self.lexicon)
+
+        # Compound rules and their matcher are shared module-level tables.
+        self._automaton = _constituent_automaton()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The memo wraps a bound method and cannot be pickled, and the
+        # automaton is a shared module-level table; both are rebuilt.
+        state = self.__dict__.copy()
+        del state["_analyze_cached"]
+        del state["_automaton"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._analyze_cached = lru_cache(maxsize=self._cache_size)(self._analyze)
+        self._automaton = _constituent_automaton()
+
     # ── public API ───────────────────────────────────────────────────────
 
     def analyze(self, word: str) -> Optional[SamasaResult]:
         """Analyze a potential compound word and return `SamasaResult`."""
-        clean = word.strip()
-        stem = self._strip_ending(clean.lower())
-
-        # 1 — Avyayībhāva
-        for prefix in self.avyaya_prefixes:
-            if clean.lower().startswith(prefix):
-                remainder = clean[len(prefix):]
-                if remainder:
-                    return SamasaResult(
-                        original=word,
-                        constituents=[prefix, remainder],
-                        compound_type="Avyayībhāva (Adverbial)",
-                        meaning_structure=f"In the manner of / regarding {remainder}",
-                    )
+        return self._analyze_cached(word)
 
-        # 2 — Dvandva (dual ending -au / -ौ)
-        result = self._try_dvandva(word, clean, stem)
-        if result:
-            return result
+    def analyze_many(self, words: Iterable[str]) -> List[Optional[SamasaResult]]:
+        """Run :meth:`analyze` for each word in *words*, in order."""
+        analyze = self.analyze
+        return [analyze(word) for word in words]
 
-        # 3 — Bahuvrīhi (pattern-matched known compounds)
-        result = self._try_bahuvrihi(word, stem)
-        if result:
-            return result
+    def clear_cache(self) -> None:
+        """Drop all memoized ``analyze`` results."""
+        self._analyze_cached.cache_clear()
+        self._avyaya_prefixes = self._longest_first(self.avyaya_prefixes)
+        self._lex_keys = self._lexicon_keys(self.lexicon)
 
-        # 4 — Karmadhāraya
-        result = self._try_karmadharaya(word, stem)
-        if result:
-            return result
+    def _analyze(self, word: str) -> Optional[SamasaResult]:
+        clean = word.strip()
+        lowered = clean.lower()
+        stem = self._strip_ending(lowered)
+
+        # 1 — Avyayībhāva (longest prefix first; one C-level check up front)
+        if lowered.startswith(self._avyaya_prefixes):
+            for prefix in self._avyaya_prefixes:
+                if lowered.startswith(prefix):
+                    remainder = clean[len(prefix):]
+                    if remainder:
+                        return SamasaResult(
+                            original=word,
+                            constituents=[prefix, remainder],
+                            compound_type="Avyayībhāva (Adverbial)",
+                            meaning_structure=f"In the manner of / regarding {remainder}",
+                        )
 
-        # 5 — Tatpuruṣa (generic split)
-        result = self._try_tatpurusha(word, stem)
+        # 2 — Dvandva (dual ending -au / -ौ)
+        result = self._try_dvandva(word, lowered)
         if result:
             return result
 
-        return None
+        # 3–5 — Bahuvrīhi, Karmadhāraya, Tatpuruṣa (known compounds)
+        return self._try_known_compounds(word, stem)
 
     # ── private helpers ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _longest_first(prefixes: List[str]) -> Tuple[str, ...]:
+        return tuple(sorted(prefixes, key=len, reverse=True))
+
+    @staticmethod
+    def _lexicon_keys(lexicon: Dict[str, str]) -> FrozenSet[str]:
+        # Every lexicon entry, plus its stem without the final "a", so a
+        # part is looked up with one probe and no concatenation.
+        return frozenset(lexicon) | frozenset(
+            k[:-1] for k in lexicon if len(k) > 1 and k.endswith("a")
+        )
+
     @staticmethod
     def _strip_ending(s: str) -> str:
         for suffix in ("ḥ", "h", "m", "ṁ", "म्", "ः"):
@@ -140,13 +244,16 @@ class SamasaAnalyzer:
         return s
 
     def _in_lex(self, part: str) -> bool:
-        return part in self.lexicon or (part + "a") in self.lexicon
+        return part in self._lex_keys
 
-    def _try_dvandva(self, word: str, clean: str, stem: str) -> Optional[SamasaResult]:
-        lc = clean.lower()
-        if not (lc.endswith("au") or clean.endswith("ौ")):
+    def _try_dvandva(self, word: str, lowered: str) -> Optional[SamasaResult]:
+        # Devanāgarī has no case, so ``lowered`` serves both scripts.
+        if lowered.endswith("au"):
+            base = lowered[:-2]
+        elif lowered.endswith("ौ"):
+            base = lowered[:-1]
+        else:
             return None
-        base = lc[:-2] if lc.endswith("au") else lc[:-1]
         for i in range(1, len(base)):
             p1, p2 = base[:i], base[i:]
             if self._in_lex(p1) and self._in_lex(p2):
@@ -158,62 +265,26 @@ class SamasaAnalyzer:
                 )
         return None
 
-    def _try_bahuvrihi(self, word: str, stem: str) -> Optional[SamasaResult]:
-        patterns = [
-            (["pīta", "pita", "पीत"], ["ambara", "अम्बर", "āmbara"],
-             "One who has yellow garments (Viṣṇu)"),
-            (["gaja", "गज"], ["ānana", "anana", "आनन"],
-             "One who has an elephant face (Gaṇeśa)"),
-            (["nara", "नर"], ["siṃha", "simha", "सिंह"],
-             "One who is a lion among men (Viṣṇu)"),
-        ]
-        for firsts, seconds, meaning in patterns:
-            for f in firsts:
-                for s in seconds:
-                    if f in stem and s in stem:
-                        return SamasaResult(
-                            original=word,
-                            constituents=[f, s],
-                            compound_type="Bahuvrīhi (Possessive)",
-                            meaning_structure=meaning,
-                        )
-        return None
-
-    def _try_karmadharaya(self, word: str, stem: str) -> Optional[SamasaResult]:
-        patterns = [
-            (["nīla", "neela", "नील"], ["kamala", "कमल"], "The blue lotus"),
-            (["mahā", "maha", "महा"], ["deva", "देव"], "The great god"),
-            (["mahā", "maha", "महा"], ["rāja", "raja", "राज"], "The great king"),
-        ]
-        for adjs, nouns, meaning in patterns:
-            for a in adjs:
-                for n in nouns:
-                    if a in stem and n in stem:
-                        return SamasaResult(
-                            original=word,
-                            constituents=[a, n],
-                            compound_type="Karmadhāraya (Descriptive)",
-                            meaning_structure=meaning,
-                        )
-        return None
+    def _present_constituents(self, stem: str) -> Set[str]:
+        """All known compound members occurring anywhere in *stem*."""
+        if self._automaton is not None:
+            return {part for _, part in self._automaton.iter(stem)}
+        return {part for part in _CONSTITUENTS if part in stem}
 
-    def _try_tatpurusha(self, word: str, stem: str) -> Optional[SamasaResult]:
-        patterns = [
-            (["rāja", "raja", "राज"], ["puruṣa", "purusha", "पुरुष"],
-             "Man of the King"),
-            (["deva", "देव"], ["dāsa", "dasa", "दास"],
-             "Servant of god"),
-            (["dharma", "धर्म"], ["artha", "अर्थ"],
-             "Meaning of dharma"),
-        ]
-        for firsts, seconds, meaning in patterns:
+    def _try_known_compounds(self, word: str, stem: str) -> Optional[SamasaResult]:
+        present = self._present_constituents(stem)
+        if not present:
+            return None
+        for compound_type, firsts, seconds, meaning in _COMPOUND_RULES:
             for f in firsts:
+                if f not in present:
+                    continue
                 for s in seconds:
-                    if f in stem and s in stem:
+                    if s in present:
                         return SamasaResult(
                             original=word,
                             constituents=[f, s],
-                            compound_type="Tatpuruṣa (Determinative)",
+                            compound_type=compound_type,
                             meaning_structure=meaning,
                         )
         return None
@@ -12,17 +12,18 @@ Both forward application (combine two terms) and reverse explanation
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from .sounds import (
     Phoneme, A, AA, I, II, U, UU, R, RR, L, E, AI, O, AU,
-    YA, VA, RA, LA, AC
+    YA, VA, RA, LA, AC, ALL_PHONEMES, PHONEME_INDEX, AK_MASK, IK_MASK, AC_MASK
 )
-from .text.processing import decompose, recompose
+from ._compat import DATACLASS_SLOTS
+from .text.processing import _decompose_cached, recompose
 
 __all__ = ["Sutra", "SandhiResult", "SandhiEngine"]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Sutra:
     """Represents a Pāṇinian Sūtra (grammar rule)."""
     id: str          # e.g. "6.1.77"
@@ -31,7 +32,7 @@ class Sutra:
     type: str = "vidhi"  # vidhi / saṃjñā / paribhāṣā / adhikāra
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SandhiResult:
     """Result of a Sandhi operation."""
     original: str
@@ -53,8 +54,109 @@ _RULES: List[Sutra] = [
           "Two similar (savarṇa) simple vowels merge into the long vowel"),
 ]
 
+_RULES_BY_ID: Dict[str, Sutra] = {r.id: r for r in _RULES}
+
 def _rule(rid: str) -> Sutra:
-    return next(r for r in _RULES if r.id == rid)
+    return _RULES_BY_ID[rid]
+
+
+# ── Vowel sandhi table ───────────────────────────────────────────────────────
+
+# Pratyāhāras used by the vowel rules
+_AK = frozenset({A.symbol, AA.symbol, I.symbol, II.symbol, U.symbol, UU.symbol,
+                 R.symbol, RR.symbol, L.symbol})
+_IK = frozenset({I.symbol, II.symbol, U.symbol, UU.symbol, R.symbol, RR.symbol,
+                 L.symbol})
+
+
+def _in(mask: int, p: Phoneme) -> bool:
+    return (mask >> PHONEME_INDEX[p.symbol]) & 1 == 1
+
+# Mapping for Yan Sandhi replacement (Ik -> Yan)
+# i/I -> y, u/U -> v, r/R -> r, l -> l
+_YAN_MAP: Dict[str, Phoneme] = {
+    I.symbol: YA, II.symbol: YA,
+    U.symbol: VA, UU.symbol: VA,
+    R.symbol: RA, RR.symbol: RA,
+    L.symbol: LA,
+}
+
+# (sutra id, phonemes replacing the junction, whether the first phoneme of
+# the second term is replaced too)
+_Junction = Tuple[str, Tuple[Phoneme, ...], bool]
+
+
+def _junction(last: Phoneme, first: Phoneme) -> Optional[_Junction]:
+    """Highest-priority sandhi for *last* + *first*, or ``None``."""
+    L_sym = last.symbol
+    F_sym = first.symbol
+
+    # Check Rules in Priority Order (simplified for now)
+
+    # 6.1.101 — Savarṇa Dīrgha (Akah Savarne Dirghah)
+    # Condition: Ak + Savarna (Similar Vowel) -> Dirgha
+    # Savarna: Same place of articulation.
+    if _in(AC_MASK, last) and _in(AC_MASK, first):
+        if last.place == first.place and _in(AK_MASK, last):
+            # Merge into Long Vowel
+            replacement = None
+            if L_sym in {A.symbol, AA.symbol}: replacement = AA
+            elif L_sym in {I.symbol, II.symbol}: replacement = II
+            elif L_sym in {U.symbol, UU.symbol}: replacement = UU
+            elif L_sym in {R.symbol, RR.symbol}: replacement = RR
+            # L usually doesn't have long form in classic, but theoretical
+
+            if replacement:
+                return "6.1.101", (replacement,), True
+
+    # 6.1.88 — Vṛddhi (Vrddhir Eci)
+    # Condition: A/AA + Ec (e, o, ai, au) -> Vrddhi (ai, au)
+    # Note: Standard sutra says "Eci" (e, o, ai, au).
+    if L_sym in {A.symbol, AA.symbol} and first.is_vowel:
+        replacement = None
+        if F_sym in {E.symbol, AI.symbol}: replacement = AI
+        elif F_sym in {O.symbol, AU.symbol}: replacement = AU
+
+        if replacement:
+            return "6.1.88", (replacement,), True
+
+    # 6.1.87 — Guṇa (Ad Gunah)
+    # Condition: A/AA + Ac (simple vowels mostly, but exceptions covered by Vrddhi)
+    # A + I -> E, A + U -> O, A + R -> Ar, A + L -> Al
+    if L_sym in {A.symbol, AA.symbol} and first.is_vowel:
+        guna: Tuple[Phoneme, ...] = ()
+        if F_sym in {I.symbol, II.symbol}: guna = (E,)
+        elif F_sym in {U.symbol, UU.symbol}: guna = (O,)
+        elif F_sym in {R.symbol, RR.symbol}: guna = (A, RA) # Ar
+        elif F_sym in {L.symbol}: guna = (A, LA) # Al
+
+        if guna:
+            return "6.1.87", guna, True
+
+    # 6.1.77 — Yaṇ (Iko Yanaci)
+    # Condition: Ik + Ac (dissimilar) -> Yan
+    if _in(IK_MASK, last) and _in(AC_MASK, first):
+        # Check dissimilarity (simplified: not same place)
+        # Actually Savarna Dirgha (6.1.101) is an exception to Yan.
+        # Since we checked 6.1.101 first, we are safe to apply Yan if 101 didn't match.
+        # (In Panini, Paratvat (later rule) applies, but 6.1.101 is later than 6.1.77 so it wins anyway).
+
+        if L_sym in _YAN_MAP:
+            return "6.1.77", (_YAN_MAP[L_sym],), False # Keep the following vowel!
+
+    return None
+
+
+# Every (last, first) phoneme pair resolved once into a flat table indexed
+# by ``PHONEME_INDEX[last] * _N + PHONEME_INDEX[first]``, so ``apply`` is two
+# index lookups instead of a cascade of membership tests.
+_N = len(ALL_PHONEMES)
+
+# Opening characters of a second term that rule out every vowel sandhi
+_NON_VOWELS = frozenset(p.symbol for p in ALL_PHONEMES if not p.is_vowel)
+_JUNCTIONS: List[Optional[_Junction]] = [
+    _junction(last, first) for last in ALL_PHONEMES for first in ALL_PHONEMES
+]
 
 
 class SandhiEngine:
@@ -70,19 +172,13 @@ class SandhiEngine:
     def __init__(self) -> None:
         self.rules = list(_RULES)
         
-        # Precompute sets for pratyaharas
-        self.AK = {A.symbol, AA.symbol, I.symbol, II.symbol, U.symbol, UU.symbol, R.symbol, RR.symbol, L.symbol}
-        self.IK = {I.symbol, II.symbol, U.symbol, UU.symbol, R.symbol, RR.symbol, L.symbol}
+        # Read-only aliases of the shared module constants, kept for
+        # callers that read them.  apply() resolves every junction through
+        # _JUNCTIONS, so editing these has no effect on it.
+        self.AK = _AK
+        self.IK = _IK
         self.AC = AC # From sounds.py
-        
-        # Mapping for Yan Sandhi replacement (Ik -> Yan)
-        # i/I -> y, u/U -> v, r/R -> r, l -> l
-        self.YAN_MAP = {
-            I.symbol: YA, II.symbol: YA,
-            U.symbol: VA, UU.symbol: VA,
-            R.symbol: RA, RR.symbol: RA,
-            L.symbol: LA
-        }
+        self.YAN_MAP = _YAN_MAP
 
     # ── public API ───────────────────────────────────────────────────────────
 
@@ -94,84 +190,43 @@ class SandhiEngine:
             return SandhiResult(f"{t1} + {t2}", f"{t1}{t2}", None, 1.0)
             
         # 1. Decompose into Phonemes
-        p1 = decompose(t1)
-        p2 = decompose(t2)
-        
-        if not p1 or not p2:
+        # (shared memoized tuples: never edited, only sliced)
+        p1 = _decompose_cached(t1)
+        if not p1:
             return SandhiResult(f"{t1} + {t2}", f"{t1}{t2}", None, 1.0)
 
-        last = p1[-1]
-        first = p2[0]
-        
-        # Logic is easier to read with symbols
-        L_sym = last.symbol
-        F_sym = first.symbol
-        
-        # Check Rules in Priority Order (simplified for now)
-
-        # 6.1.101 — Savarṇa Dīrgha (Akah Savarne Dirghah)
-        # Condition: Ak + Savarna (Similar Vowel) -> Dirgha
-        # Savarna: Same place of articulation.
-        if last.is_vowel and first.is_vowel:
-            if last.place == first.place and L_sym in self.AK:
-                # Merge into Long Vowel
-                replacement = None
-                if L_sym in {A.symbol, AA.symbol}: replacement = AA
-                elif L_sym in {I.symbol, II.symbol}: replacement = II
-                elif L_sym in {U.symbol, UU.symbol}: replacement = UU
-                elif L_sym in {R.symbol, RR.symbol}: replacement = RR
-                # L usually doesn't have long form in classic, but theoretical
-                
-                if replacement:
-                    new_phonemes = p1[:-1] + [replacement] + p2[1:]
-                    return self._result(t1, t2, new_phonemes, "6.1.101")
-
-        # 6.1.88 — Vṛddhi (Vrddhir Eci)
-        # Condition: A/AA + Ec (e, o, ai, au) -> Vrddhi (ai, au)
-        # Note: Standard sutra says "Eci" (e, o, ai, au).
-        if L_sym in {A.symbol, AA.symbol} and first.is_vowel:
-             replacement = None
-             if F_sym in {E.symbol, AI.symbol}: replacement = AI
-             elif F_sym in {O.symbol, AU.symbol}: replacement = AU
-             
-             if replacement:
-                 new_phonemes = p1[:-1] + [replacement] + p2[1:]
-                 return self._result(t1, t2, new_phonemes, "6.1.88")
-
-        # 6.1.87 — Guṇa (Ad Gunah)
-        # Condition: A/AA + Ac (simple vowels mostly, but exceptions covered by Vrddhi)
-        # A + I -> E, A + U -> O, A + R -> Ar, A + L -> Al
-        if L_sym in {A.symbol, AA.symbol} and first.is_vowel:
-             replacement = []
-             if F_sym in {I.symbol, II.symbol}: replacement = [E]
-             elif F_sym in {U.symbol, UU.symbol}: replacement = [O]
-             elif F_sym in {R.symbol, RR.symbol}: replacement = [A, RA] # Ar
-             elif F_sym in {L.symbol}: replacement = [A, LA] # Al
-             
-             if replacement:
-                 new_phonemes = p1[:-1] + replacement + p2[1:]
-                 return self._result(t1, t2, new_phonemes, "6.1.87")
-
-        # 6.1.77 — Yaṇ (Iko Yanaci)
-        # Condition: Ik + Ac (dissimilar) -> Yan
-        if L_sym in self.IK and first.is_vowel:
-            # Check dissimilarity (simplified: not same place)
-            # Actually Savarna Dirgha (6.1.101) is an exception to Yan.
-            # Since we checked 6.1.101 first, we are safe to apply Yan if 101 didn't match.
-            # (In Panini, Paratvat (later rule) applies, but 6.1.101 is later than 6.1.77 so it wins anyway).
-            
-            if L_sym in self.YAN_MAP:
-                yan = self.YAN_MAP[L_sym]
-                new_phonemes = p1[:-1] + [yan] + p2 # Keep the following vowel!
-                return self._result(t1, t2, new_phonemes, "6.1.77")
+        # Every rule joins two vowels, so a second term opening with a
+        # consonant or modifier rules them all out before it is decomposed.
+        if t2[0] in _NON_VOWELS:
+            return SandhiResult(f"{t1} + {t2}", f"{t1} {t2}", None, 0.0)
+
+        p2 = _decompose_cached(t2)
+        if not p2:
+            return SandhiResult(f"{t1} + {t2}", f"{t1}{t2}", None, 1.0)
+
+        junction = _JUNCTIONS[
+            PHONEME_INDEX[p1[-1].symbol] * _N + PHONEME_INDEX[p2[0].symbol]
+        ]
+        if junction is not None:
+            rid, replacement, replaces_first = junction
+            rest = p2[1:] if replaces_first else p2
+            return self._result(t1, t2, p1[:-1] + replacement + rest, rid)
 
         # No applicable rule
         return SandhiResult(f"{t1} + {t2}", f"{t1} {t2}", None, 0.0)
 
+    def apply_many(self, pairs: Iterable[Tuple[str, str]]) -> List[SandhiResult]:
+        """Run :meth:`apply` for each ``(term1, term2)`` pair, in order."""
+        apply = self.apply
+        return [apply(t1, t2) for t1, t2 in pairs]
+
     def explain(self, text: str) -> List[str]:
         """Heuristic reverse-engineering."""
         # TODO: Upgrade to phoneme based explanation
         explanations: List[str] = []
+        # Every marker below is a Devanāgarī sign; str.isascii() is O(1).
+        if text.isascii():
+            return explanations
         if "्य" in text or "्व" in text:
              explanations.append("Possible Yaṇ Sandhi (6.1.77)")
         if "े" in text or "ो" in text:
@@ -188,7 +243,7 @@ class SandhiEngine:
 
     # ── helpers ──────────────────────────────────────────────────────────────
 
-    def _result(self, t1: str, t2: str, phonemes: List[Phoneme], rid: str) -> SandhiResult:
+    def _result(self, t1: str, t2: str, phonemes: Iterable[Phoneme], rid: str) -> SandhiResult:
         combined = recompose(phonemes)
         return SandhiResult(
             original=f"{t1} + {t2}",
@@ -10,14 +10,17 @@ Inspired by Briggs (1985) "Knowledge Representation in Sanskrit and AI".
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+import sys
+from typing import Any, Dict, List, Optional, Sequence
 
+from ._compat import DATACLASS_SLOTS
 from .morphology import MorphologicalAnalyzer, MorphAnalysis
 
 __all__ = ["SemanticNode", "SemanticEdge", "SemanticGraph", "SemanticParser"]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SemanticNode:
     """A node in the semantic network."""
     id: str
@@ -26,7 +29,7 @@ class SemanticNode:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SemanticEdge:
     """A directed edge (relation) in the semantic network."""
     source_id: str
@@ -47,6 +50,10 @@ class SemanticGraph:
     def add_edge(self, edge: SemanticEdge) -> None:
         self.edges.append(edge)
 
+    def node_index(self) -> Dict[str, SemanticNode]:
+        """Map node ids to nodes; the first node wins for a repeated id."""
+        return {n.id: n for n in reversed(self.nodes)}
+
     def to_dict(self) -> Dict[str, Any]:
         """Serializable dictionary representation."""
         return {
@@ -64,9 +71,10 @@ class SemanticGraph:
     def summary(self) -> str:
         """Human-readable summary of the graph."""
         lines = [f"SemanticGraph: {len(self.nodes)} nodes, {len(self.edges)} edges"]
+        by_id = self.node_index()
         for e in self.edges:
-            src = next((n for n in self.nodes if n.id == e.source_id), None)
-            tgt = next((n for n in self.nodes if n.id == e.target_id), None)
+            src = by_id.get(e.source_id)
+            tgt = by_id.get(e.target_id)
             if src and tgt:
                 lines.append(f"  {src.label} --[{e.relation}]--> {tgt.label}")
         return "\n".join(lines)
@@ -98,14 +106,16 @@ class SemanticParser:
 
     def parse(self, sentence: str) -> SemanticGraph:
         """Parse a space-separated Sanskrit sentence into a SemanticGraph."""
+        return self.parse_words(sentence.split())
+
+    def parse_words(self, words: Sequence[str]) -> SemanticGraph:
+        """Like :meth:`parse`, for a sentence already split into words."""
         graph = SemanticGraph()
-        words = sentence.split()
 
         action_node: Optional[SemanticNode] = None
         participants: List[tuple] = []  # (node, role_str)
 
-        for word in words:
-            analyses = self.analyzer.analyze(word)
+        for word, analyses in zip(words, self.analyzer.analyze_many(words)):
             if not analyses:
                 continue
             analysis = analyses[0]  # take first (most likely)
@@ -156,13 +166,16 @@ class SemanticParser:
                 graph.add_edge(SemanticEdge(
                     source_id=action_node.id,
                     target_id=pnode.id,
-                    relation=role,
+                    relation=sys.intern(role),
                 ))
 
         return graph
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _simplify(full_role: str) -> str:
+        # Only a handful of distinct Kāraka strings exist, so each is
+        # scanned once and then answered from the cache.
         for key, val in _ROLE_SIMPLIFY.items():
             if key in full_role:
                 return val
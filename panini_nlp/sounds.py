@@ -7,7 +7,9 @@ Defines atomic sounds and their properties for the Sandhi Engine.
 from dataclasses import dataclass
 from typing import Dict, List, Set, Optional
 
-@dataclass(frozen=True)
+from ._compat import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Phoneme:
     symbol: str       # The atomic character (e.g., 'अ', 'क', '्')
     is_vowel: bool    # True if Swara (Ac)
@@ -113,3 +115,21 @@ MATRA_MAP: Dict[str, Phoneme] = {
 # Sets for quick lookup
 AC = {p.symbol for p in ALL_PHONEMES if p.is_vowel}
 HAL = {p.symbol for p in ALL_PHONEMES if not p.is_vowel and p != VIRAMA}
+
+# ── Compact alphabet ─────────────────────────────────────────────────────────
+# Each phoneme's position in ALL_PHONEMES, so rule tables can be flat lists
+# and pratyāhāras integer bitmasks tested with ``(MASK >> index) & 1``.
+PHONEME_INDEX: Dict[str, int] = {p.symbol: i for i, p in enumerate(ALL_PHONEMES)}
+
+
+def pratyahara_mask(*phonemes: Phoneme) -> int:
+    """Bitmask with the bit of every phoneme in *phonemes* set."""
+    mask = 0
+    for p in phonemes:
+        mask |= 1 << PHONEME_INDEX[p.symbol]
+    return mask
+
+
+AK_MASK = pratyahara_mask(A, AA, I, II, U, UU, R, RR, L)
+IK_MASK = pratyahara_mask(I, II, U, UU, R, RR, L)
+AC_MASK = pratyahara_mask(*(p for p in ALL_PHONEMES if p.is_vowel))
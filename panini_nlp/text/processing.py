@@ -4,9 +4,21 @@ Text Processing Module (Varna-Vibhasha).
 Decomposes Devanagari text into atomic Phonemes for the Sandhi Engine.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 from ..sounds import SYMBOL_MAP, MATRA_MAP, VIRAMA, A, Phoneme
 
+# Symbols that carry a vowel: every non-vowel except the virama.  The
+# per-character loop then needs one set test instead of Phoneme comparisons.
+_TAKES_VOWEL = frozenset(
+    p.symbol for p in SYMBOL_MAP.values() if not p.is_vowel and p != VIRAMA
+)
+_VIRAMA = VIRAMA.symbol
+_A = A.symbol
+# Modifiers written as-is, never followed by a virama.
+_NO_VIRAMA = frozenset({"्", "ं", "ः"})
+
+
 def decompose(text: str) -> List[Phoneme]:
     """
     Decompose Devanagari text into atomic Phonemes.
@@ -24,110 +36,102 @@ def decompose(text: str) -> List[Phoneme]:
         List[Phoneme]: Stream of atomic sounds (e.g. [D, E, V, A, ...])
     """
     phonemes: List[Phoneme] = []
+    append = phonemes.append
     i = 0
     n = len(text)
-    
+
     while i < n:
+        # 1. Is it a known symbol?  Unknown chars (whitespace, punctuation)
+        # are skipped.
         char = text[i]
-        
-        # 1. Is it a known symbol?
-        if char not in SYMBOL_MAP:
-             # Skip unknown chars (whitespaces, punctuation)
-             # Future: Add Punctuation/Space as Tokens
-             i += 1
-             continue
-             
-        p = SYMBOL_MAP[char]
-        
-        # 2. Vowel (Swara)
-        if p.is_vowel:
-            phonemes.append(p)
-            i += 1
+        p = SYMBOL_MAP.get(char)
+        i += 1
+        if p is None:
             continue
-            
-        # 3. Consonant (Vyanjana) - excluding special modifiers
-        if not p.is_vowel and p != VIRAMA:
-            # Emit the consonant
-            phonemes.append(p)
-            
-            # Look ahead for modifier
-            if i + 1 < n:
-                next_char = text[i+1]
-                
-                # Case A: Matra (Vowel Sign)
-                if next_char in MATRA_MAP:
-                    phonemes.append(MATRA_MAP[next_char])
-                    i += 2
-                    continue
-                
-                # Case B: Virama (Halant)
-                elif next_char == VIRAMA.symbol:
-                    # Do NOT emit 'a'. Consonant is bare.
-                    i += 2
-                    continue
-            
-            # Case C: No modifier -> Implicit 'a'
-            # (Unless it's Anusvara/Visarga which follow vowels/consonants? 
-            # Actually Anusvara follows vowel. 
-            # If we have 'Kam', it is K + A + M_dot.
-            # So if next is Anusvara, we still need the 'a' on the 'K'.)
-            
-            phonemes.append(A)
-            i += 1
+        append(p)
+
+        # 2. Vowels (Swara) and a standalone virama stand alone.
+        if char not in _TAKES_VOWEL:
             continue
-            
-        # 4. Modifiers (should have been handled by lookahead, but if standalone...)
-        # e.g. Anusvara or Visarga at start? Unlikely.
-        # But Visarga usually follows a Vowel.
-        # If we encounter them here, just append.
-        phonemes.append(p)
-        i += 1
-        
+
+        # 3. Consonant (Vyanjana): look ahead for a modifier
+        if i < n:
+            next_char = text[i]
+
+            # Case A: Matra (Vowel Sign)
+            matra = MATRA_MAP.get(next_char)
+            if matra is not None:
+                append(matra)
+                i += 1
+                continue
+
+            # Case B: Virama (Halant) -- do NOT emit 'a'; consonant is bare.
+            if next_char == _VIRAMA:
+                i += 1
+                continue
+
+        # Case C: No modifier -> Implicit 'a'
+        # (Anusvara/Visarga are handled like consonants here, so a
+        # standalone one also receives the implicit 'a'.)
+        append(A)
+
     return phonemes
 
-def recompose(phonemes: List[Phoneme]) -> str:
+@lru_cache(maxsize=8192)
+def _decompose_cached(text: str) -> Tuple[Phoneme, ...]:
+    """Memoized ``decompose`` for recurring terms (e.g. sandhi operands).
+
+    The tuple is shared between callers and must not be edited; slice it.
+    """
+    return tuple(decompose(text))
+
+def decompose_many(texts: Iterable[str]) -> List[List[Phoneme]]:
+    """Decompose every text in *texts*; each result is a fresh list.
+
+    Texts repeated within or across batches are decomposed only once.
+    """
+    cached = _decompose_cached
+    return [list(cached(text)) for text in texts]
+
+def recompose(phonemes: Iterable[Phoneme]) -> str:
     """
     Recompose Phonemes back into Devanagari text.
     (Simple version for v0.2)
     """
-    res = []
-    for idx, p in enumerate(phonemes):
+    res: List[str] = []
+    append = res.append
+    # Whether the previous phoneme is a consonant without a virama, i.e.
+    # one that the current vowel attaches to as a matra.
+    after_consonant = False
+
+    # Each phoneme is visited with its successor through a one-item
+    # lookahead on an iterator, so any iterable of phonemes works.
+    it = iter(phonemes)
+    p = next(it, None)
+    while p is not None:
+        nxt = next(it, None)
+        symbol = p.symbol
+
         # 1. Vowel
         if p.is_vowel:
-            # Check previous
-            if idx > 0 and not phonemes[idx-1].is_vowel and phonemes[idx-1] != VIRAMA:
-                 # If previous was a consonant that didn't get a virama, 
-                 # it means we are the vowel for it.
-                 # Check if we are 'A' (implicit)
-                 if p == A:
-                     continue # Don't write anything
-                 elif p.as_matra:
-                     res.append(p.as_matra)
-                 else:
-                     res.append(p.symbol) # Fallback (should be matra)
+            if after_consonant:
+                # We are the vowel for the previous consonant: the implicit
+                # 'a' is not written, other vowels become matras.
+                if symbol != _A:
+                    append(p.as_matra or symbol)
             else:
-                 # Independent vowel (start of word or after another vowel)
-                 res.append(p.symbol)
-        
+                # Independent vowel (start of word or after another vowel)
+                append(symbol)
+            after_consonant = False
+
         # 2. Consonant
         else:
-            res.append(p.symbol)
-            # If next is NOT a vowel and NOT a modifier, we might need a Virama?
-            # Actually, standard logic: always write consonant.
-            # If next is NOT a vowel, we assume implicit 'a' in script 
-            # UNLESS we explicitly write Virama.
-            # Wait, my logic is reverse.
+            append(symbol)
             # In list: [K, T] -> K has no vowel. So we MUST write [K, Virama, T].
-            
-            if not p.is_vowel and p.symbol not in {"्", "ं", "ः"}:
-                # Check next
-                has_vowel_next = False
-                if idx + 1 < len(phonemes):
-                    if phonemes[idx+1].is_vowel:
-                        has_vowel_next = True
-                
-                if not has_vowel_next:
-                    # Consonant with no vowel following -> Needs Virama
-                    res.append(VIRAMA.symbol)
-                    
+            if symbol not in _NO_VIRAMA and (nxt is None or not nxt.is_vowel):
+                append(_VIRAMA)
+            after_consonant = symbol != _VIRAMA
+
+        p = nxt
+
     return "".join(res)
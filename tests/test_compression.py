@@ -0,0 +1,82 @@
+"""Tests for the .meru compressor."""
+
+import json
+import unittest
+import zlib
+
+from panini_nlp import compression
+from panini_nlp.compression import MeruCompressor
+
+
+@unittest.skipUnless(compression._HAS_MSGPACK, "msgpack not installed")
+class TestMeruCompressor(unittest.TestCase):
+    def setUp(self):
+        self.comp = MeruCompressor()
+        self.data = [
+            {"state": "AP", "city": "Hyd", "pop": 10},
+            {"state": "AP", "city": "Viz", "pop": 2},
+            {"state": "TS", "city": "Hyd", "pop": 10},
+        ]
+
+    def test_roundtrip(self):
+        blob = self.comp.compress(self.data, "test")
+        self.assertEqual(self.comp.decompress(blob), self.data)
+
+    def test_roundtrip_mixed_columns(self):
+        data = [
+            {"w": "a", "n": -5, "big": 1 << 40, "f": 0.5, "b": True, "o": None},
+            {"w": "a", "n": 70000, "big": 1, "f": 2.0, "b": False, "o": 3},
+        ]
+        self.assertEqual(self.comp.decompress(self.comp.compress(data)), data)
+
+    def test_roundtrip_missing_key_in_distinct_column(self):
+        data = [{"a": "x", "b": 1}, {"b": 2}]
+        self.assertEqual(
+            self.comp.decompress(self.comp.compress(data)),
+            [{"a": "x", "b": 1}, {"a": None, "b": 2}],
+        )
+
+    def test_empty(self):
+        blob = self.comp.compress([], "empty")
+        self.assertEqual(self.comp.decompress(blob), [])
+
+    def test_reads_legacy_zlib_blob(self):
+        """Blobs written by the zlib-only format must still decode."""
+        import msgpack
+
+        seed = {
+            "meta": {"type": "meru_sutra_v1", "name": "old"},
+            "schema": ["state", "city"],
+            "dna": {"state": ["AP"]},
+            "stream": [[0, "Hyd"], [0, "Viz"]],
+        }
+        blob = zlib.compress(msgpack.packb(seed, use_bin_type=True), level=9)
+        self.assertEqual(
+            self.comp.decompress(blob),
+            [{"state": "AP", "city": "Hyd"}, {"state": "AP", "city": "Viz"}],
+        )
+
+    @unittest.skipUnless(compression._HAS_ZSTD, "zstandard not installed")
+    def test_dictionary_blobs_need_the_dictionary(self):
+        if compression._load_dictionary() is None:
+            self.skipTest("no bundled dictionary")
+        plain = MeruCompressor(use_dictionary=False)
+        # Dictless blobs still decode with the dictionary loaded ...
+        self.assertEqual(self.comp.decompress(plain.compress(self.data)), self.data)
+        # ... but not the other way round.
+        with self.assertRaises(ValueError):
+            plain.decompress(self.comp.compress(self.data))
+
+    def test_corrupt_blob(self):
+        self.assertEqual(self.comp.decompress(b"not a meru blob"), [])
+
+    def test_compare_sizes_uses_compact_json_baseline(self):
+        blob = self.comp.compress(self.data)
+        sizes = MeruCompressor.compare_sizes(self.data, blob)
+        compact = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        self.assertEqual(sizes["json_bytes"], len(compact.encode("utf-8")))
+        self.assertEqual(sizes["ratio"], round(len(blob) / sizes["json_bytes"], 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
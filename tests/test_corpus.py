@@ -6,8 +6,9 @@ from panini_nlp.corpus import AshtadhyayiCorpus, DhatupathaCorpus, SanskritCorpu
 
 
 class TestAshtadhyayiCorpus(unittest.TestCase):
-    def setUp(self):
-        self.corpus = AshtadhyayiCorpus()
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = AshtadhyayiCorpus()
 
     def test_count_is_large(self):
         self.assertGreater(self.corpus.count, 3900)
@@ -21,10 +22,18 @@ class TestAshtadhyayiCorpus(unittest.TestCase):
         hits = self.corpus.search("गुण")
         self.assertGreater(len(hits), 0)
 
+    def test_search_many_matches_search(self):
+        queries = ["गुण", "वृद्धि", "1.1.", "", "no such text"]
+        for limit in (5, 1, 0, -1):
+            results = self.corpus.search_many(queries, limit=limit)
+            for q in queries:
+                self.assertEqual(results[q], self.corpus.search(q, limit=limit))
+
 
 class TestDhatupathaCorpus(unittest.TestCase):
-    def setUp(self):
-        self.corpus = DhatupathaCorpus()
+    @classmethod
+    def setUpClass(cls):
+        cls.corpus = DhatupathaCorpus()
 
     def test_count_is_large(self):
         self.assertGreater(self.corpus.count, 2200)
@@ -34,6 +43,13 @@ class TestDhatupathaCorpus(unittest.TestCase):
         self.assertIsNotNone(d)
         self.assertIn("भू", d.dhatu)
 
+    def test_search_many_matches_search(self):
+        queries = ["भू", "सत्तायाम्", "", "no such text"]
+        for limit in (5, 1, 0, -1):
+            results = self.corpus.search_many(queries, limit=limit)
+            for q in queries:
+                self.assertEqual(results[q], self.corpus.search(q, limit=limit))
+
     def test_find_roots(self):
         hits = self.corpus.find_roots("भू")
         self.assertGreater(len(hits), 0)
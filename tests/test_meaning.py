@@ -1,8 +1,11 @@
 """Tests for meaning engine."""
 
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 from panini_nlp.meaning import SanskritMeaningEngine
+import panini_nlp.validator as validator_module
 
 
 class TestMeaningEngine(unittest.TestCase):
@@ -24,6 +27,44 @@ class TestMeaningEngine(unittest.TestCase):
         self.assertEqual(report.segments[0].meaning, "Rama goes to the forest.")
         self.assertGreaterEqual(report.summary["average_meaning_confidence"], 0.8)
 
+    def test_batch_translator_called_once(self):
+        calls = []
+
+        def translate_all(texts):
+            calls.append(list(texts))
+            return [f"EN: {t}" for t in texts]
+
+        engine = SanskritMeaningEngine(translator_batch=translate_all)
+        report = engine.analyze_document_meaning("रामः वनम् गच्छति। देवः पठति॥", split_mode="verse")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(calls[0]), report.segment_count)
+        for segment in report.segments:
+            self.assertEqual(segment.meaning, f"EN: {segment.source}")
+            self.assertEqual(segment.meaning_mode, "fluent_model")
+
+    def test_batch_length_mismatch_falls_back_per_segment(self):
+        engine = SanskritMeaningEngine(
+            translator=lambda text: f"ONE: {text}",
+            translator_batch=lambda texts: ["only one"],
+        )
+        report = engine.analyze_document_meaning("रामः वनम् गच्छति। देवः पठति॥", split_mode="verse")
+        self.assertEqual(report.segment_count, 2)
+        for segment in report.segments:
+            self.assertEqual(segment.meaning, f"ONE: {segment.source}")
+
+    def test_parallel_matches_serial(self):
+        engine = SanskritMeaningEngine()
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः पठति।"
+        serial = engine.analyze_document_meaning(text, meaning_mode="literal")
+        # Three segments: lower the threshold so n_jobs=2 really starts a pool.
+        engine.validator.parallel_threshold = 1
+        with mock.patch.object(
+            validator_module, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            parallel = engine.analyze_document_meaning(text, meaning_mode="literal", n_jobs=2)
+        pool.assert_called_once()
+        self.assertEqual(serial.to_dict(), parallel.to_dict())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,17 +1,42 @@
 """Tests for panini-nlp package."""
 
+import copy
+import dataclasses
+import io
+import json
+import pickle
+import subprocess
+import sys
+import unicodedata
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 from panini_nlp.sandhi import SandhiEngine
 from panini_nlp.morphology import MorphologicalAnalyzer
 from panini_nlp.semantics import SemanticParser
 from panini_nlp.chandas import ChandasAnalyzer
 from panini_nlp.samasa import SamasaAnalyzer
 from panini_nlp.validator import SanskritValidator
+import panini_nlp.validator as validator_module
+
+
+class _TaggingValidator(SanskritValidator):
+    """Validator whose constructor requires an argument (for pool tests)."""
+
+    def __init__(self, tag):
+        super().__init__(cache_size=16)
+        self.tag = tag
+
+    def _validate(self, text):
+        result = super()._validate(text)
+        result.warnings.append(self.tag)
+        return result
 
 
 class TestSandhi(unittest.TestCase):
-    def setUp(self):
-        self.engine = SandhiEngine()
+    @classmethod
+    def setUpClass(cls):
+        cls.engine = SandhiEngine()
 
     def test_dirgha_sandhi(self):
         """6.1.101 — अ + अ → आ"""
@@ -25,6 +50,17 @@ class TestSandhi(unittest.TestCase):
         self.assertIsNotNone(result.rule_applied)
         self.assertEqual(result.rule_applied.id, "6.1.87")
 
+    def test_engine_pickles_and_copies(self):
+        """The engine survives pickle and deepcopy with working rules."""
+        for clone in (pickle.loads(pickle.dumps(self.engine)), copy.deepcopy(self.engine)):
+            self.assertEqual(clone.apply("देव", "आलय").modified, "देवालय")
+            self.assertEqual(clone.YAN_MAP, self.engine.YAN_MAP)
+
+    def test_apply_many_matches_apply(self):
+        pairs = [("देव", "आलय"), ("अ", "इन्द्रः"), ("राम", "गच्छति"), ("अ", "अग्नि")]
+        batch = self.engine.apply_many(pairs)
+        self.assertEqual(batch, [self.engine.apply(a, b) for a, b in pairs])
+
     def test_explain(self):
         """explain() should return explanations for sandhi-eligible text."""
         explanations = self.engine.explain("देवेन्द्रः")
@@ -37,8 +73,9 @@ class TestSandhi(unittest.TestCase):
 
 
 class TestMorphology(unittest.TestCase):
-    def setUp(self):
-        self.analyzer = MorphologicalAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = MorphologicalAnalyzer()
 
     def test_nominative(self):
         """Recognize nominative singular -ः."""
@@ -54,6 +91,31 @@ class TestMorphology(unittest.TestCase):
         accs = [r for r in results if r.vibhakti == "Accusative"]
         self.assertTrue(len(accs) > 0)
 
+    def test_analysis_round_trips(self):
+        """Analyses pickle, deep-copy and convert to plain dicts."""
+        for word in ("रामः", "गच्छति", "च"):
+            a = self.analyzer.analyze(word)[0]
+            self.assertEqual(pickle.loads(pickle.dumps(a)), a)
+            self.assertEqual(copy.deepcopy(a), a)
+            as_dict = dataclasses.asdict(a)
+            self.assertEqual(json.loads(json.dumps(as_dict)), as_dict)
+
+    def test_editing_a_result_does_not_reach_the_memo(self):
+        """Mutating returned attributes leaves later analyses intact."""
+        analyzer = MorphologicalAnalyzer()
+        first = analyzer.analyze("रामः")[0]
+        expected = dict(first.attributes)
+        first.attributes["case"] = "X"
+        self.assertEqual(analyzer.analyze("रामः")[0].attributes, expected)
+
+    def test_analyze_many_matches_analyze(self):
+        """Batch analysis returns per-word results in input order."""
+        words = ["रामः", "वनम्", "गच्छति", "रामः"]
+        self.assertEqual(
+            self.analyzer.analyze_many(words),
+            [self.analyzer.analyze(w) for w in words],
+        )
+
     def test_verb(self):
         """Recognize verb ending -ति."""
         results = self.analyzer.analyze("गच्छति")
@@ -61,10 +123,20 @@ class TestMorphology(unittest.TestCase):
         verbs = [r for r in results if r.category == "Tiṅanta"]
         self.assertTrue(len(verbs) > 0)
 
+    def test_analyze_is_memoized(self):
+        """Repeated words hit the memo and still get fresh copies."""
+        analyzer = MorphologicalAnalyzer()
+        first = analyzer.analyze("रामः")
+        again = analyzer.analyze(" रामः ")
+        self.assertEqual(analyzer._analyze_cached.cache_info().hits, 1)
+        self.assertEqual(first, again)
+        self.assertIsNot(first[0].attributes, again[0].attributes)
+
 
 class TestSemantics(unittest.TestCase):
-    def setUp(self):
-        self.parser = SemanticParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = SemanticParser()
 
     def test_parse_sentence(self):
         """Parse a basic sentence into a kāraka graph."""
@@ -77,10 +149,16 @@ class TestSemantics(unittest.TestCase):
         graph = self.parser.parse("रामः वनम् गच्छति")
         self.assertGreater(len(graph.edges), 0)
 
+    def test_parser_deep_copies(self):
+        """A deep-copied parser keeps a working analyzer memo."""
+        parser = copy.deepcopy(self.parser)
+        self.assertEqual(len(parser.parse("रामः वनम् गच्छति").edges), 2)
+
 
 class TestChandas(unittest.TestCase):
-    def setUp(self):
-        self.analyzer = ChandasAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = ChandasAnalyzer()
 
     def test_analyze_iast(self):
         """Analyze IAST text for prosody."""
@@ -88,6 +166,13 @@ class TestChandas(unittest.TestCase):
         self.assertGreater(result.syllable_count, 0)
         self.assertIn(result.pattern[0], ["0", "1"])
 
+    def test_analyze_is_memoized(self):
+        """Repeated text reuses the cached MeterResult."""
+        first = self.analyzer.analyze("dharmasya tattvam")
+        self.assertIs(first, self.analyzer.analyze("dharmasya tattvam"))
+        self.analyzer.clear_cache()
+        self.assertIsNot(first, self.analyzer.analyze("dharmasya tattvam"))
+
     def test_prastara(self):
         """Generate all patterns of length n."""
         patterns = self.analyzer.prastara(3)
@@ -102,8 +187,9 @@ class TestChandas(unittest.TestCase):
 
 
 class TestSamasa(unittest.TestCase):
-    def setUp(self):
-        self.analyzer = SamasaAnalyzer()
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = SamasaAnalyzer()
 
     def test_bahuvrihi(self):
         """Detect Bahuvrīhi compound."""
@@ -119,9 +205,27 @@ class TestSamasa(unittest.TestCase):
         self.assertIn("Avyayībhāva", result.compound_type)
 
 
+class TestAnalyzerPickling(unittest.TestCase):
+    def test_analyzers_pickle_and_copy(self):
+        """Pickled and deep-copied analyzers rebuild a working memo."""
+        cases = [
+            (MorphologicalAnalyzer(), ["रामस्य"], lambda r: r),
+            (ChandasAnalyzer(), ["Dharmasya tattvam nihitam guhayam"], lambda r: r.pattern),
+            (SamasaAnalyzer(), ["pītāmbaram", "rāmakṛṣṇau"], lambda r: r),
+        ]
+        for analyzer, inputs, view in cases:
+            with self.subTest(analyzer=type(analyzer).__name__):
+                expected = [view(analyzer.analyze(t)) for t in inputs]
+                for clone in (pickle.loads(pickle.dumps(analyzer)), copy.deepcopy(analyzer)):
+                    self.assertEqual([view(clone.analyze(t)) for t in inputs], expected)
+                    clone.clear_cache()
+                    self.assertEqual([view(clone.analyze(t)) for t in inputs], expected)
+
+
 class TestValidator(unittest.TestCase):
-    def setUp(self):
-        self.validator = SanskritValidator()
+    @classmethod
+    def setUpClass(cls):
+        cls.validator = SanskritValidator()
 
     def test_validate_basic(self):
         """Full pipeline on a basic sentence."""
@@ -135,6 +239,52 @@ class TestValidator(unittest.TestCase):
         self.assertIsInstance(result.grammar_patterns, dict)
         self.assertIn("sandhi", result.grammar_patterns)
 
+    def test_cached_results_are_independent(self):
+        """Repeated validation returns equal results that do not share state."""
+        first = self.validator.validate("रामः वनम् गच्छति")
+        first.suggestions.append("edited")
+        first.semantic_graph["nodes"][0]["metadata"]["role"] = "edited"
+        second = self.validator.validate("रामः वनम् गच्छति")
+        self.assertNotIn("edited", second.suggestions)
+        self.assertNotEqual(second.semantic_graph["nodes"][0]["metadata"]["role"], "edited")
+        self.validator.clear_cache()
+        self.assertEqual(self.validator.validate("रामः वनम् गच्छति"), second)
+
+    def test_trailing_danda_is_not_part_of_word(self):
+        """A daṇḍa attached to the last word should not hide its analysis."""
+        result = self.validator.validate("रामः वनम् गच्छति।")
+        self.assertTrue(any(s.startswith("Morphology (गच्छति)") for s in result.suggestions))
+        self.assertIn("गच्छ (गच्छति) --[object]--> वन (वनम्)", result.suggestions)
+
+    def test_decomposed_input_is_normalized(self):
+        """Decomposed IAST should be analyzed like its precomposed form."""
+        text = "rāmaḥ vanaṃ gacchati"
+        decomposed = unicodedata.normalize("NFD", text)
+        self.assertEqual(
+            self.validator.validate(decomposed).grammar_patterns,
+            self.validator.validate(text).grammar_patterns,
+        )
+
+    def test_nukta_letters_normalize_decomposed(self):
+        """NFC leaves क़ as क + nukta, so both spellings analyze alike."""
+        precomposed = "\u0958लमः पठति"
+        decomposed = "\u0915\u093cलमः पठति"
+        self.assertEqual(unicodedata.normalize("NFC", precomposed), decomposed)
+        one = self.validator.validate(precomposed)
+        two = self.validator.validate(decomposed)
+        self.assertEqual(one.grammar_patterns, two.grammar_patterns)
+        self.assertEqual(one.suggestions, two.suggestions)
+        self.assertEqual(one.warnings, two.warnings)
+
+    def test_validator_pickles(self):
+        """A validator survives a pickle round trip with its analyzers."""
+        clone = pickle.loads(pickle.dumps(SanskritValidator()))
+        self.assertIs(clone.semantics.analyzer, clone.morphology)
+        self.assertEqual(
+            clone.validate("रामः वनम् गच्छति"),
+            self.validator.validate("रामः वनम् गच्छति"),
+        )
+
     def test_empty_input(self):
         """Empty input should return is_valid=False."""
         result = self.validator.validate("")
@@ -155,11 +305,91 @@ class TestValidator(unittest.TestCase):
         doc = self.validator.validate_document(text, split_mode="line")
         self.assertEqual(doc["segment_count"], 2)
 
+    def test_validate_document_parallel_matches_serial(self):
+        """Worker processes should produce the same report as the serial path."""
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः पठति।"
+        serial = self.validator.validate_document(text)
+        validator = SanskritValidator()
+        validator.parallel_threshold = 0
+        parallel = validator.validate_document(text, n_jobs=2)
+        self.assertEqual(serial, parallel)
+
+    def test_iter_validate_document_matches_report(self):
+        """Streamed segments should match the aggregated report."""
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः वनम् गच्छति।"
+        doc = self.validator.validate_document(text)
+        streamed = list(self.validator.iter_validate_document(text))
+        self.assertEqual(
+            [(i, seg, vr.to_dict()) for i, seg, vr in streamed],
+            [(s["index"], s["text"], s["result"]) for s in doc["segments"]],
+        )
+
+    def test_validate_document_to_json_matches_report(self):
+        """The streamed JSON should load back into the same report."""
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः पठति।"
+        buf = io.StringIO()
+        summary = self.validator.validate_document_to_json(text, buf)
+        doc = self.validator.validate_document(text)
+        self.assertEqual(json.loads(buf.getvalue()), doc)
+        self.assertEqual(summary, doc["summary"])
+
+    def test_split_collapses_delimiter_runs(self):
+        """Delimiter runs split once; leading/trailing pieces are kept."""
+        self.assertEqual(
+            SanskritValidator._split_document("।रामः॥।देवः\n", "verse"),
+            ["", "रामः", "देवः", ""],
+        )
+        self.assertEqual(
+            SanskritValidator._split_document("रामः! देवः?।", "sentence"),
+            ["रामः", "देवः", ""],
+        )
+
+    def test_parallel_threshold_gates_the_pool(self):
+        """The pool starts only at the threshold, and matches serial output."""
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः वनम् गच्छति। रामः पठति।"
+        validator = SanskritValidator()
+        serial = validator.validate_document(text)
+        with mock.patch.object(
+            validator_module, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            validator.parallel_threshold = 4  # 3 distinct segments
+            self.assertEqual(validator.validate_document(text, n_jobs=2), serial)
+            pool.assert_not_called()
+            validator.parallel_threshold = 1
+            self.assertEqual(validator.validate_document(text, n_jobs=2), serial)
+            pool.assert_called_once()
+
+    def test_parallel_workers_use_configured_validator(self):
+        """Workers should run the parent's instance, not a default one."""
+        text = "रामः वनम् गच्छति। देवः पठति॥ रामः पठति।"
+        validator = _TaggingValidator("tagged")
+        serial = validator.validate_document(text)
+        validator.parallel_threshold = 1
+        parallel = validator.validate_document(text, n_jobs=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(parallel["segments"][0]["result"]["warnings"], ["tagged"])
+
     def test_validate_document_invalid_mode(self):
         """Invalid split mode should raise ValueError."""
         with self.assertRaises(ValueError):
             self.validator.validate_document("रामः", split_mode="chunk")
 
 
+class TestRootRegistry(unittest.TestCase):
+    def test_direct_gana_import_keeps_gana_order(self):
+        """Importing one gana first must not reorder the registry."""
+        script = (
+            "import panini_nlp.roots.gana_3_juhotyadi\n"
+            "from panini_nlp.roots import registry\n"
+            "print(' '.join(d.id for d in registry))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        self.assertEqual(out, sorted(out, key=lambda i: tuple(map(int, i.split(".")))))
+        self.assertEqual(out[0], "1.1")
+
+
 if __name__ == "__main__":
     unittest.main()